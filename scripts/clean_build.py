@@ -1,12 +1,18 @@
 import os
+import sys
 import shutil
 import glob
+import argparse
 
 # Configuration
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # fpga/
+sys.path.append(os.path.join(PROJECT_ROOT, "sim"))
+import build_cache
 DIRS_TO_REMOVE = [
     "sim/xsim.dir",
     "sim/.Xil",
+    "sim/work",
+    "sim/obj_dir",
     "FIFO/FIFO.cache",
     "FIFO/FIFO.hw",
     "FIFO/FIFO.sim",
@@ -29,6 +35,12 @@ FILES_TO_REMOVE = [
     "sim/*.str",
     "sim/response.txt",
     "sim/stimulus.txt",
+    "sim/response.bin",
+    "sim/stimulus.bin",
+    "sim/throughput.txt",
+    "sim/sim.vvp",
+    "sim/Vtb",
+    "sim/waves.vcd",
     "sim/dfx_runtime.txt",
     "FIFO/*.log",
     "FIFO/*.jou"
@@ -61,7 +73,27 @@ def clean_python_cache():
             if file.endswith(".pyc"):
                 os.remove(os.path.join(root, file))
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Remove build/simulation artifacts")
+    parser.add_argument("--prune-cache", type=int, metavar="MB", default=None,
+                        help="Only prune the build cache (LRU) down to MB megabytes")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Also delete the whole build cache (sim/.build_cache)")
+    return parser.parse_args()
+
+def prune_cache(max_mb):
+    print(f"=== Pruning build cache to {max_mb} MB ===")
+    removed = build_cache.evict(max_mb)
+    for key in removed:
+        print(f"   [CACHE] Evicted: {key}")
+    print(f"   {len(removed)} entries removed")
+
 def main():
+    args = parse_args()
+    if args.prune_cache is not None:
+        prune_cache(args.prune_cache)
+        return
+
     print("=== Starting Project Cleanup ===")
     
     # 1. Clean defined directories
@@ -74,6 +106,10 @@ def main():
 
     # 3. Deep clean Python cache
     clean_python_cache()
+
+    # 4. Build cache survives normal cleans unless asked
+    if args.clear_cache:
+        remove_directory(build_cache.CACHE_DIR)
     
     print("\n=== Cleanup Complete ===")
     print("Project is clean. Ready for Git or a fresh build.")
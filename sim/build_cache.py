@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+# Cache lives next to the scripts (sim/.build_cache) unless overridden
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".build_cache")
+DEFAULT_MAX_MB = 2048
+
+# Strings are matched first so "//" inside a $display literal is kept
+_SV_TOKENS = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/', re.DOTALL)
+
+
+def _strip_sv_comments(text):
+    return _SV_TOKENS.sub(lambda m: m.group(0) if m.group(0).startswith('"') else " ", text)
+
+
+def normalized_source(path):
+    """
+    File contents with comments and whitespace-only changes removed, so a
+    comment edit in the RTL, testbench or Tcl does not invalidate the cache.
+    """
+    with open(path, "r", errors="replace") as f:
+        text = f.read()
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".sv", ".v", ".svh", ".vh"):
+        text = _strip_sv_comments(text)
+        lines = text.splitlines()
+    elif ext in (".tcl", ".xdc"):
+        lines = [l for l in text.splitlines() if not l.lstrip().startswith("#")]
+    else:
+        lines = text.splitlines()
+    return "\n".join(" ".join(l.split()) for l in lines if l.strip())
+
+
+def tool_fingerprint(tool):
+    """
+    Identify the installed tool without launching it: resolved path, size
+    and mtime change whenever Vivado is upgraded or repointed.
+    """
+    path = shutil.which(tool)
+    if path is None:
+        return f"{tool}:missing"
+    st = os.stat(path)
+    return f"{os.path.realpath(path)}:{st.st_size}:{int(st.st_mtime)}"
+
+
+def content_key(kind, files, extra=()):
+    """Hash of normalized input files plus flags/tool identifiers."""
+    h = hashlib.sha256(kind.encode())
+    for path in files:
+        h.update(b"\0" + os.path.basename(path).encode() + b"\0")
+        if os.path.exists(path):
+            h.update(normalized_source(path).encode())
+        else:
+            h.update(b"<missing>")
+    for item in extra:
+        h.update(b"\0" + str(item).encode())
+    return h.hexdigest()[:32]
+
+
+def _entry_dir(key, cache_dir):
+    return os.path.join(cache_dir, key)
+
+
+def _read_meta(entry):
+    try:
+        with open(os.path.join(entry, "meta.json"), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(entry, meta):
+    tmp = os.path.join(entry, f"meta.json.{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp, os.path.join(entry, "meta.json"))
+
+
+def _tree_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def lookup(key, cache_dir=CACHE_DIR):
+    """Return the cached metadata for key (and mark it used), or None."""
+    entry = _entry_dir(key, cache_dir)
+    meta = _read_meta(entry)
+    if meta is None:
+        return None
+    meta["last_used"] = time.time()
+    try:
+        _write_meta(entry, meta)
+    except OSError:
+        # Access time is advisory; a concurrent touch or eviction is harmless
+        pass
+    return meta
+
+
+def store(key, artifacts, results=None, cache_dir=CACHE_DIR):
+    """
+    Copy artifacts ({name: file or directory}) into the cache under key.
+    The entry is assembled in a temp dir and renamed so parallel workers
+    never see a half-written entry.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    entry = _entry_dir(key, cache_dir)
+    if _read_meta(entry) is not None:
+        # Same key means same inputs; another worker already stored it
+        return
+    staging = tempfile.mkdtemp(prefix=f".{key}.", dir=cache_dir)
+    try:
+        for name, src in artifacts.items():
+            if not os.path.exists(src):
+                continue
+            dst = os.path.join(staging, name)
+            if os.path.isdir(src):
+                shutil.copytree(src, dst)
+            else:
+                shutil.copy2(src, dst)
+        now = time.time()
+        _write_meta(staging, {"key": key, "created": now, "last_used": now,
+                              "size": _tree_size(staging), "results": results})
+        try:
+            os.rename(staging, entry)
+        except OSError:
+            # Lost the race to a parallel worker storing the same key
+            pass
+    finally:
+        if os.path.exists(staging):
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def restore(key, name, dest, cache_dir=CACHE_DIR):
+    """Copy one cached artifact back out; returns False if it was not cached."""
+    src = os.path.join(_entry_dir(key, cache_dir), name)
+    if not os.path.exists(src):
+        return False
+    if os.path.isdir(src):
+        if os.path.exists(dest):
+            shutil.rmtree(dest)
+        shutil.copytree(src, dest)
+    else:
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        shutil.copy2(src, dest)
+    return True
+
+
+def evict(max_mb=DEFAULT_MAX_MB, cache_dir=CACHE_DIR):
+    """Delete least-recently-used entries until the cache fits in max_mb."""
+    if not os.path.isdir(cache_dir):
+        return []
+    entries = []
+    for key in os.listdir(cache_dir):
+        if key.startswith("."):
+            continue
+        meta = _read_meta(_entry_dir(key, cache_dir))
+        if meta is None:
+            # Corrupt or foreign directory, drop it
+            shutil.rmtree(_entry_dir(key, cache_dir), ignore_errors=True)
+            continue
+        entries.append((meta.get("last_used", 0), meta.get("size", 0), key))
+
+    limit = max_mb * 1024 * 1024
+    total = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, key in sorted(entries):
+        if total <= limit:
+            break
+        shutil.rmtree(_entry_dir(key, cache_dir), ignore_errors=True)
+        total -= size
+        removed.append(key)
+    return removed
+
+
+def clear(cache_dir=CACHE_DIR):
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
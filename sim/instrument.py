@@ -0,0 +1,187 @@
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows: no rusage, RSS columns stay empty
+    resource = None
+
+# Set by start(); pool workers inherit it, so every process appends its own events
+TRACE_ENV = "FIFO_PHASE_TRACE_DIR"
+
+
+def enabled():
+    return TRACE_ENV in os.environ
+
+
+def _rss_mb(maxrss):
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return maxrss / (1024.0 * 1024.0) if sys.platform == "darwin" else maxrss / 1024.0
+
+
+def _usage():
+    """(wall, cpu self, cpu children, peak rss self MB, peak rss children MB) right now."""
+    t = os.times()
+    rss_self = rss_children = None
+    if resource is not None:
+        rss_self = _rss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        rss_children = _rss_mb(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return (time.perf_counter(), time.process_time(), t.children_user + t.children_system,
+            rss_self, rss_children)
+
+
+def _emit(event):
+    path = os.path.join(os.environ[TRACE_ENV], f"events_{os.getpid()}.jsonl")
+    with open(path, "a") as f:
+        f.write(json.dumps(event) + "\n")
+
+
+class Phase:
+    """Handle yielded by phase(); lets the body attach arguments and child usage."""
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.child_cpu_s = None
+        self.child_rss_mb = None
+
+    def annotate(self, **args):
+        self.args.update(args)
+
+    def set_child_usage(self, cpu_s=None, max_rss_kb=None):
+        """Exact usage of the tool this phase waited for (from wait4), if known."""
+        if cpu_s is not None:
+            self.child_cpu_s = cpu_s
+        if max_rss_kb is not None:
+            self.child_rss_mb = _rss_mb(max_rss_kb)
+
+
+@contextmanager
+def phase(name, cat="python", **args):
+    """
+    Time a block: wall, CPU of this process and of the children it reaped,
+    and peak RSS of both. No-op bookkeeping when tracing is not started.
+    """
+    handle = Phase(name, cat, args)
+    if not enabled():
+        yield handle
+        return
+
+    ts = time.time()
+    wall0, cpu0, child0, _, child_rss0 = _usage()
+    status = "ok"
+    try:
+        yield handle
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        wall1, cpu1, child1, rss1, child_rss1 = _usage()
+        child_rss = handle.child_rss_mb
+        if child_rss is None and child_rss1 is not None and child_rss1 > (child_rss0 or 0):
+            # RUSAGE_CHILDREN is a high-water mark, only attributable when it moved
+            child_rss = child_rss1
+        _emit({
+            "name": name, "cat": cat, "pid": os.getpid(), "ts": ts,
+            "wall_s": wall1 - wall0,
+            "cpu_self_s": cpu1 - cpu0,
+            "cpu_children_s": (handle.child_cpu_s if handle.child_cpu_s is not None
+                               else child1 - child0),
+            "peak_rss_self_mb": rss1,
+            "peak_rss_children_mb": child_rss,
+            "status": status,
+            "args": handle.args,
+        })
+
+
+def record(name, start_ts, end_ts, cat="tool", **args):
+    """Add a span measured elsewhere (e.g. a marker in a tool log); wall time only."""
+    if enabled():
+        _emit({"name": name, "cat": cat, "pid": os.getpid(), "ts": start_ts,
+               "wall_s": end_ts - start_ts, "cpu_self_s": None, "cpu_children_s": None,
+               "peak_rss_self_mb": None, "peak_rss_children_mb": None,
+               "status": "ok", "args": args})
+
+
+def start(trace_dir):
+    """Enable tracing for this process and every worker it spawns afterwards."""
+    os.makedirs(trace_dir, exist_ok=True)
+    for name in os.listdir(trace_dir):
+        if name.startswith("events_") and name.endswith(".jsonl"):
+            os.remove(os.path.join(trace_dir, name))
+    os.environ[TRACE_ENV] = os.path.abspath(trace_dir)
+
+
+def collect():
+    """All events written by this run, oldest first."""
+    if not enabled():
+        return []
+    trace_dir = os.environ[TRACE_ENV]
+    events = []
+    for name in sorted(os.listdir(trace_dir)):
+        if name.startswith("events_") and name.endswith(".jsonl"):
+            with open(os.path.join(trace_dir, name)) as f:
+                events.extend(json.loads(line) for line in f if line.strip())
+    events.sort(key=lambda e: e["ts"])
+    return events
+
+
+def summarize(events):
+    """Per phase name: calls, wall total/max, CPU self/children, peak RSS; slowest first."""
+    rows = {}
+    for e in events:
+        r = rows.setdefault(e["name"], {"phase": e["name"], "cat": e["cat"], "calls": 0,
+                                        "wall_s": 0.0, "wall_max_s": 0.0,
+                                        "cpu_self_s": 0.0, "cpu_children_s": 0.0,
+                                        "peak_rss_self_mb": None, "peak_rss_children_mb": None})
+        r["calls"] += 1
+        r["wall_s"] += e["wall_s"]
+        r["wall_max_s"] = max(r["wall_max_s"], e["wall_s"])
+        r["cpu_self_s"] += e["cpu_self_s"] or 0.0
+        r["cpu_children_s"] += e["cpu_children_s"] or 0.0
+        for key in ("peak_rss_self_mb", "peak_rss_children_mb"):
+            if e[key] is not None:
+                r[key] = max(r[key] or 0.0, e[key])
+    return sorted(rows.values(), key=lambda r: -r["wall_s"])
+
+
+def write_json(events, path):
+    with open(path, "w") as f:
+        json.dump({"summary": summarize(events), "events": events}, f, indent=2)
+
+
+def write_chrome_trace(events, path):
+    """Trace-event format for chrome://tracing or ui.perfetto.dev; one row per process."""
+    main_pid = os.getpid()
+    trace = []
+    for pid in sorted({e["pid"] for e in events}):
+        label = "run_compare" if pid == main_pid else f"worker {pid}"
+        trace.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                      "args": {"name": label}})
+    for e in events:
+        args = dict(e["args"], status=e["status"])
+        for key in ("cpu_self_s", "cpu_children_s", "peak_rss_self_mb", "peak_rss_children_mb"):
+            if e[key] is not None:
+                args[key] = round(e[key], 3)
+        trace.append({"name": e["name"], "cat": e["cat"], "ph": "X", "pid": e["pid"], "tid": 0,
+                      "ts": e["ts"] * 1e6, "dur": e["wall_s"] * 1e6, "args": args})
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+
+def _fmt(val, spec=".2f"):
+    return "-" if val is None else format(val, spec)
+
+
+def print_summary(rows):
+    print(f"{'PHASE':<22} | {'CALLS':>5} | {'WALL s':>8} | {'MAX s':>7} | {'CPU s':>7} | "
+          f"{'CHILD CPU s':>11} | {'RSS MB':>7} | {'CHILD RSS MB':>12}")
+    print("-"*100)
+    for r in rows:
+        print(f"{r['phase']:<22} | {r['calls']:>5} | {r['wall_s']:>8.2f} | "
+              f"{r['wall_max_s']:>7.2f} | {r['cpu_self_s']:>7.2f} | "
+              f"{r['cpu_children_s']:>11.2f} | {_fmt(r['peak_rss_self_mb'], '.0f'):>7} | "
+              f"{_fmt(r['peak_rss_children_mb'], '.0f'):>12}")
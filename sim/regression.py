@@ -0,0 +1,162 @@
+import os
+import sys
+import json
+import random
+import shutil
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import run_compare
+from tests import test_library
+
+DESIGN_KEYS = {"sync": "fifo_sync_top", "async": "async_fifo"}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Multi-seed FIFO regression farm")
+    parser.add_argument("--design", "-d", choices=["sync", "async", "all"], default="all",
+                        help="Which design to run (default: all)")
+    parser.add_argument("--tests", nargs="+", choices=test_library.all_tests(),
+                        default=test_library.all_tests(),
+                        help="Generators to run (default: every gen_* in test_library)")
+    parser.add_argument("--seeds", type=int, default=10,
+                        help="Seeds per randomized test (default: 10)")
+    parser.add_argument("--base-seed", type=int, default=1,
+                        help="Master seed the per-test seeds are drawn from (default: 1)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Parallel simulation workers (default: CPU count)")
+    parser.add_argument("--results", default="regression.jsonl",
+                        help="Resumable JSONL results file (default: regression.jsonl)")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Ignore existing results and start over")
+    parser.add_argument("--keep-work", action="store_true",
+                        help="Keep work directories of passing runs")
+    parser.add_argument("--simulator", choices=list(run_compare.simulators.BACKENDS),
+                        default="xsim", help="Simulation backend (default: xsim)")
+    parser.add_argument("--sim-threads", type=int, default=1,
+                        help="Verilator model threads per job (default: 1)")
+    parser.add_argument("--replay", metavar="TEST:SEED",
+                        help="Re-run one recorded test/seed in sim/ with full output")
+    return parser.parse_args()
+
+
+def select_designs(choice):
+    if choice == "all":
+        return run_compare.DESIGNS
+    return [d for d in run_compare.DESIGNS if d['synth_top'] == DESIGN_KEYS[choice]]
+
+
+def seed_list(base_seed, count):
+    """Deterministic seeds so the same command line always means the same jobs."""
+    rng = random.Random(base_seed)
+    return [rng.getrandbits(32) for _ in range(count)]
+
+
+def build_jobs(designs, tests, seeds):
+    jobs = []
+    for design in designs:
+        for test in tests:
+            # Directed tests ignore the seed, run them once
+            for seed in (seeds if test_library.is_randomized(test) else [0]):
+                jobs.append((design, test, seed))
+    return jobs
+
+
+def job_key(design_name, test, seed, simulator):
+    return f"{design_name}|{test}|{seed}|{simulator}"
+
+
+def load_completed(path):
+    """Keys of jobs already recorded; a truncated last line is ignored."""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            done.add(job_key(rec['design'], rec['test'], rec['seed'],
+                             rec.get('simulator', "xsim")))
+    return done
+
+
+def run_job(design, test, seed, work_dir, keep_work=False, simulator="xsim", sim_threads=1):
+    """Worker: one simulation in its own work dir, console output to sim.log there."""
+    os.makedirs(work_dir, exist_ok=True)
+    with open(os.path.join(work_dir, "sim.log"), "w") as log, \
+            contextlib.redirect_stdout(log):
+        result = run_compare.run_simulation(design, work_dir=work_dir, test=test, seed=seed,
+                                            simulator=simulator, sim_threads=sim_threads)
+    if result['status'] == "PASS" and not keep_work:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return result
+
+
+def main():
+    args = parse_args()
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    if args.replay:
+        test, seed = args.replay.split(":")
+        for design in select_designs(args.design):
+            run_compare.run_simulation(design, test=test, seed=int(seed),
+                                       simulator=args.simulator, sim_threads=args.sim_threads)
+        return
+
+    designs = select_designs(args.design)
+    jobs = build_jobs(designs, args.tests, seed_list(args.base_seed, args.seeds))
+
+    if args.fresh and os.path.exists(args.results):
+        os.remove(args.results)
+    done = load_completed(args.results)
+    pending = [j for j in jobs if job_key(j[0]['name'], j[1], j[2], args.simulator) not in done]
+    print(f"Regression: {len(jobs)} jobs, {len(jobs) - len(pending)} already recorded, "
+          f"{len(pending)} to run on {args.jobs} workers")
+
+    failures = []
+    with open(args.results, "a") as out, ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {}
+        for design, test, seed in pending:
+            work_dir = os.path.join(run_compare.PATHS['work'], "regress",
+                                    design['synth_top'], f"{test}_{seed}")
+            futures[pool.submit(run_job, design, test, seed, work_dir, args.keep_work,
+                                args.simulator, args.sim_threads)] = (design, test, seed, work_dir)
+
+        for i, future in enumerate(as_completed(futures), 1):
+            design, test, seed, work_dir = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"status": "ERROR", "transactions": 0, "error": str(e)}
+            rec = {"design": design['name'], "top": design['synth_top'],
+                   "test": test, "seed": seed, "status": result['status'], "transactions": result['transactions'],
+                   "simulator": args.simulator, "work_dir": work_dir}
+            if "error" in result:
+                rec["error"] = result["error"]
+            # Append and flush each record so an interrupted run can resume
+            out.write(json.dumps(rec) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+
+            symbol = "[OK]" if rec['status'] == "PASS" else "[FAIL]"
+            print(f"  [{i}/{len(pending)}] {symbol} {design['name']} {test} seed={seed}")
+            if rec['status'] != "PASS":
+                failures.append(rec)
+
+    print("\n" + "-"*60)
+    print(f"REGRESSION SUMMARY: {len(pending) - len(failures)}/{len(pending)} passed this run")
+    for rec in failures:
+        flag = {top: key for key, top in DESIGN_KEYS.items()}[rec['top']]
+        print(f"  [FAIL] {rec['design']} {rec['test']} seed={rec['seed']}  "
+              f"(replay: python regression.py -d {flag} --simulator {rec['simulator']} "
+              f"--replay {rec['test']}:{rec['seed']})")
+    print("-"*60)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
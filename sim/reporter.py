@@ -42,7 +42,7 @@ def generate_charts(results, output_dir="."):
     plt.close()
     print(f"Generated Chart: {output_path}")
 
-def generate_markdown(results, output_dir="."):
+def generate_markdown(results, output_dir=".", timings=None):
     output_path = os.path.join(output_dir, "REPORT.md")
     
     with open(output_path, "w") as f:
@@ -72,5 +72,114 @@ def generate_markdown(results, output_dir="."):
         f.write("- **Flip-Flops**: Sequential elements (pointers, synchronizers)\n")
         f.write("- **WNS**: Worst Negative Slack (setup timing margin)\n")
         f.write("- **WHS**: Worst Hold Slack (hold timing margin)\n")
+
+        if timings:
+            f.write("\n## 4. Phase Timings\n\n")
+            f.write("Wall time summed over calls (parallel workers overlap). Child columns cover "
+                    "the Vivado/xsim processes. Full timeline: `phase_trace.json`.\n\n")
+            f.write("| Phase | Calls | Wall (s) | Max (s) | CPU (s) | Child CPU (s) | "
+                    "Peak RSS (MB) | Child Peak RSS (MB) |\n")
+            f.write("| :--- | :---: | ---: | ---: | ---: | ---: | ---: | ---: |\n")
+            for t in timings:
+                rss = t['peak_rss_self_mb']
+                child_rss = t['peak_rss_children_mb']
+                f.write(f"| {t['phase']} | {t['calls']} | {t['wall_s']:.2f} | "
+                        f"{t['wall_max_s']:.2f} | {t['cpu_self_s']:.2f} | "
+                        f"{t['cpu_children_s']:.2f} | "
+                        f"{'-' if rss is None else f'{rss:.0f}'} | "
+                        f"{'-' if child_rss is None else f'{child_rss:.0f}'} |\n")
+    
+    print(f"Generated Report: {output_path}")
+
+def _num(val):
+    """Report value to float, None when synthesis failed or the field is missing."""
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return None
+
+def find_crossovers(rows):
+    """
+    For every (design, data width, clock period) series ordered by depth, the first
+    depth that fails timing (WNS < 0) and the first depth that maps to block RAM.
+    """
+    series = {}
+    for r in rows:
+        series.setdefault((r['design'], r['data_width'], r['period']), []).append(r)
+
+    crossovers = []
+    for (design, dw, period), pts in sorted(series.items()):
+        pts.sort(key=lambda r: r['depth'])
+        timing_fail = next((r['depth'] for r in pts
+                            if _num(r.get('wns')) is not None and _num(r['wns']) < 0), None)
+        to_bram = next((r['depth'] for r in pts if (_num(r.get('bram')) or 0) > 0), None)
+        crossovers.append({"design": design, "data_width": dw, "period": period,
+                           "timing_fail_depth": timing_fail, "bram_depth": to_bram})
+    return crossovers
+
+def generate_scaling_curves(rows, output_dir="."):
+    """
+    Resource and WNS scaling curves from a synthesis sweep, one figure per
+    target clock period with a line per (design, data width).
+    """
+    paths = []
+    for period in sorted({r['period'] for r in rows}):
+        pts = [r for r in rows if r['period'] == period]
+        fig, axes = plt.subplots(2, 2, figsize=(12, 9))
+        panels = [
+            (axes[0][0], lambda r: (_num(r.get('lut_logic')) or 0) + (_num(r.get('lut_mem')) or 0),
+             "LUTs (logic + memory)"),
+            (axes[0][1], lambda r: _num(r.get('ffs')), "Flip-Flops"),
+            (axes[1][0], lambda r: _num(r.get('bram')), "Block RAM Tiles"),
+            (axes[1][1], lambda r: _num(r.get('wns')), "WNS (ns)"),
+        ]
+        for ax, metric, label in panels:
+            for design, dw in sorted({(r['design'], r['data_width']) for r in pts}):
+                line = sorted((r for r in pts if r['design'] == design and r['data_width'] == dw),
+                              key=lambda r: r['depth'])
+                xs = [r['depth'] for r in line if metric(r) is not None]
+                ys = [metric(r) for r in line if metric(r) is not None]
+                if xs:
+                    ax.plot(xs, ys, marker='o', label=f"{design} DW={dw}")
+            ax.set_xscale('log', base=2)
+            ax.set_xlabel('Depth (words)')
+            ax.set_ylabel(label)
+            ax.grid(True, alpha=0.3)
+        axes[1][1].axhline(0, color='red', linestyle='--', linewidth=1)
+        axes[0][0].legend(fontsize=8)
+        fig.suptitle(f'Synthesis QoR Scaling @ {period} ns target')
+        plt.tight_layout()
+
+        output_path = os.path.join(output_dir, f'scaling_{period:g}ns.png')
+        plt.savefig(output_path)
+        plt.close()
+        paths.append(output_path)
+        print(f"Generated Chart: {output_path}")
+    return paths
+
+def generate_sweep_markdown(rows, crossovers, chart_paths, output_dir="."):
+    output_path = os.path.join(output_dir, "SYNTH_SWEEP.md")
+    
+    with open(output_path, "w") as f:
+        f.write("# Synthesis QoR Sweep\n\n")
+        
+        f.write("## 1. Crossover Points\n\n")
+        f.write("| Design | Data Width | Period (ns) | First Depth Failing Timing | First Depth in BRAM |\n")
+        f.write("| :--- | :---: | :---: | :---: | :---: |\n")
+        for c in crossovers:
+            f.write(f"| {c['design']} | {c['data_width']} | {c['period']} | "
+                    f"{c['timing_fail_depth'] or 'none'} | {c['bram_depth'] or 'none'} |\n")
+        
+        f.write("\n## 2. Scaling Curves\n\n")
+        for path in chart_paths:
+            f.write(f"![{os.path.basename(path)}]({os.path.basename(path)})\n\n")
+        
+        f.write("## 3. All Points\n\n")
+        f.write("| Design | Depth | Data Width | Period (ns) | LUT Logic | LUT Memory | Flip-Flops | BRAM | WNS (ns) | WHS (ns) |\n")
+        f.write("| :--- | :---: | :---: | :---: | :---: | :---: | :---: | :---: | :---: | :---: |\n")
+        for r in sorted(rows, key=lambda r: (r['design'], r['period'], r['data_width'], r['depth'])):
+            f.write(f"| {r['design']} | {r['depth']} | {r['data_width']} | {r['period']} | "
+                    f"{r.get('lut_logic', 'N/A')} | {r.get('lut_mem', 'N/A')} | {r.get('ffs', 'N/A')} | "
+                    f"{r.get('bram', 'N/A')} | {r.get('wns', 'N/A')} | {r.get('whs', 'N/A')} |\n")
     
-    print(f"Generated Report: {output_path}")
\ No newline at end of file
+    print(f"Generated Report: {output_path}")
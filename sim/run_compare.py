@@ -3,16 +3,26 @@ import os
 import re
 import sys
 import argparse
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 # Add parent paths for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import scoreboard
 import reporter
+import build_cache
+import trace_format
+import throughput
+import tool_runner
+import instrument
+import simulators
 from tests import test_library
 
 # --- CONFIG ---
-VIVADO_BIN = r"C:\AMDDesignTools\2025.2\Vivado\bin" 
-if VIVADO_BIN not in os.environ["PATH"]:
+# Only prepended when present, so Linux hosts and open-source simulators use PATH as is
+VIVADO_BIN = os.environ.get("VIVADO_BIN", r"C:\AMDDesignTools\2025.2\Vivado\bin")
+if os.path.isdir(VIVADO_BIN) and VIVADO_BIN not in os.environ["PATH"]:
     os.environ["PATH"] = VIVADO_BIN + os.pathsep + os.environ["PATH"]
 
 # Paths relative to sim/ directory
@@ -20,9 +30,11 @@ PATHS = {
     "rtl": "../rtl",
     "tb": "../tb",
     "tcl": "tcl",
+    "constraints": "../constraints",
     "output": "../output",
     "reports": "../output/reports",
     "schematics": "../output/schematics",
+    "work": "work",
 }
 
 DESIGNS = [
@@ -32,7 +44,7 @@ DESIGNS = [
         "tb": f"{PATHS['tb']}/tb_fifo_unified.sv",
         "sim_top": "tb_fifo_unified",
         "synth_top": "fifo_sync_top",
-        "flags": ""
+        "defines": []
     },
     {
         "name": "Async FIFO",
@@ -40,7 +52,7 @@ DESIGNS = [
         "tb": f"{PATHS['tb']}/tb_fifo_unified.sv",
         "sim_top": "tb_fifo_unified",
         "synth_top": "async_fifo",
-        "flags": "-d ASYNC_MODE"
+        "defines": ["ASYNC_MODE"]
     }
 ]
 
@@ -58,6 +70,35 @@ def parse_args():
                         help="Run simulation only, skip synthesis")
     parser.add_argument("--synth-only", action="store_true",
                         help="Run synthesis only, skip simulation")
+    parser.add_argument("--stream", action="store_true",
+                        help="Use the constant-memory streaming scoreboard")
+    parser.add_argument("--max-mismatches", type=int, default=1,
+                        help="Mismatches reported before the streaming scoreboard aborts (default: 1)")
+    parser.add_argument("--trace-format", choices=["text", "binary"], default="text",
+                        help="Stimulus/response trace format (default: text, binary needs numpy)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Parallel simulation/synthesis workers, each in its own work dir (default: 1)")
+    parser.add_argument("--throughput", action="store_true",
+                        help="Concurrent write/read drivers; report bandwidth, CDC latency and stalls")
+    parser.add_argument("--fail-on-critical", action="store_true",
+                        help="Kill a tool run as soon as it prints a CRITICAL WARNING")
+    parser.add_argument("--fail-on-timing", action="store_true",
+                        help="Kill synthesis as soon as it reports unmet timing")
+    parser.add_argument("--timeout", action="append", default=[], metavar="PHASE=SECONDS",
+                        help="Per-phase time limit, e.g. --timeout synth=900 (phases: xvlog, "
+                             "xelab, xsim, iverilog, vvp, verilator, verilated, synth)")
+    parser.add_argument("--simulator", choices=list(simulators.BACKENDS), default="xsim",
+                        help="Simulation backend (default: xsim)")
+    parser.add_argument("--sim-threads", type=int, default=1,
+                        help="Verilator model threads (--threads); ignored by other backends")
+    parser.add_argument("--test", choices=test_library.all_tests(), default="gen_simultaneous_burst",
+                        help="Stimulus generator from tests/test_library.py (default: gen_simultaneous_burst)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed for randomized tests; printed on every run for exact replay")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore the incremental build cache and rebuild everything")
+    parser.add_argument("--cache-size-mb", type=int, default=build_cache.DEFAULT_MAX_MB,
+                        help=f"Build cache size limit, LRU evicted (default: {build_cache.DEFAULT_MAX_MB})")
     return parser.parse_args()
 
 def open_vivado_gui(design):
@@ -79,37 +120,148 @@ def ensure_output_dirs():
     for key in ["output", "reports", "schematics"]:
         os.makedirs(PATHS[key], exist_ok=True)
 
+def design_work_dir(design, phase):
+    """Scratch directory for one design/phase so parallel tool runs never share files."""
+    return os.path.join(PATHS['work'], design['synth_top'], phase)
+
+def open_waveform_viewer(design, wave_file, backend=None):
+    backend = backend or simulators.get("xsim")
+    if os.path.exists(wave_file):
+        print(f"\n  Opening waveform viewer for {design['name']}...")
+        print(f"  (Close the viewer to continue)")
+        backend.open_waveform(wave_file)
+    else:
+        print(f"  WARNING: Waveform file not found: {wave_file}")
+
 def print_log_tail(logfile, lines=20):
     if os.path.exists(logfile):
         print(f"\n--- TAIL of {logfile} ---")
         with open(logfile, 'r') as f:
-            for line in f.readlines()[-lines:]:
+            # Bounded window, the log is streamed rather than loaded whole
+            for line in deque(f, maxlen=lines):
                 print(line.strip())
         print("----------------------------\n")
 
-def run_simulation(design, open_waveform=False):
+def tool_options(args):
+    """Output rules and per-phase timeouts for tool_runner from the CLI flags."""
+    timeouts = {}
+    for item in args.timeout:
+        phase, _, seconds = item.partition("=")
+        timeouts[phase] = float(seconds)
+    return {"rules": tool_runner.build_rules(args.fail_on_critical, args.fail_on_timing),
+            "timeouts": timeouts}
+
+def run_tool(cmd, phase, cwd, tool_opts=None, label=None, **kwargs):
+    """Streaming, timed tool run that raises ToolError (a CalledProcessError) on failure."""
+    opts = tool_opts or {}
+    with instrument.phase(phase, cat="tool", design=label) as timing:
+        result = tool_runner.run_tool(cmd, phase, cwd=cwd, rules=opts.get("rules"),
+                                      timeout=opts.get("timeouts", {}).get(phase), **kwargs)
+        timing.set_child_usage(result.cpu_s, result.max_rss_kb)
+        timing.annotate(status=result.status)
+        # "PHASE: <name>" lines split a long tool run (e.g. synth vs schematic)
+        ends = [ts for ts, _ in result.marks[1:]] + [result.end_ts]
+        for (ts, name), end in zip(result.marks, ends):
+            instrument.record(f"{phase}:{name}", ts, end, design=label)
+        if not result.ok:
+            raise tool_runner.ToolError(result)
+    return result
+
+def report_tool_failure(err, logfile, lines=20):
+    if isinstance(err, tool_runner.ToolError):
+        tool_runner.print_tail(err.result, lines)
+    else:
+        print_log_tail(logfile, lines)
+
+def run_simulation(design, open_waveform=False, stream=False, max_mismatches=1,
+                   trace="text", work_dir=".", use_cache=True,
+                   test="gen_simultaneous_burst", seed=None, measure_throughput=False,
+                   generics=None, plusargs=None, tool_opts=None,
+                   simulator="xsim", sim_threads=1, dump_waves=False):
     print(f"\n{'='*60}")
     print(f"  SIMULATING: {design['name']}")
     print(f"{'='*60}")
     
-    with open("stimulus.txt", "w") as f:
-        test_library.gen_simultaneous_burst(f)
+    # Always pick a concrete seed so any failure can be replayed
+    if seed is None:
+        seed = random.randrange(2**32)
+    backend = simulators.get(simulator, threads=sim_threads,
+                             waveform=open_waveform or dump_waves)
+    print(f"  Test: {test}  Seed: {seed}  Simulator: {backend.name}")
+    
+    # Parameter overrides need their own snapshot, plusargs do not
+    generics = dict(design.get('generics', {}), **(generics or {}))
+    depth = 1 << int(generics.get('ADDR_WIDTH', 5))
+
+    # All tool I/O lives in work_dir; sources are referenced by absolute path
+    os.makedirs(work_dir, exist_ok=True)
+    def work(name):
+        return os.path.join(work_dir, name)
+
+    defines = list(design['defines'])
+    if measure_throughput:
+        # Throughput drivers read text stimulus only
+        trace = "text"
+        defines.append("THROUGHPUT_MODE")
+    label = design['synth_top']
+    with instrument.phase("stimulus", design=label, test=test):
+        if trace == "binary":
+            with open(work("stimulus.bin"), "wb") as f:
+                test_library.generate(trace_format.BinaryStimulusWriter(f), test, seed, depth)
+            defines.append("BINARY_TRACE")
+        else:
+            with open(work("stimulus.txt"), "w") as f:
+                test_library.generate(f, test, seed, depth)
+
+    rtl = os.path.abspath(design['rtl'])
+    tb = os.path.abspath(design['tb'])
+    build_cmds = backend.build_commands(rtl, tb, design['sim_top'], defines, generics)
+    # Backend-specific error/warning patterns on top of the CLI rule set
+    opts = dict(tool_opts or {})
+    opts["rules"] = (opts.get("rules") or tool_runner.DEFAULT_RULES) + backend.rules
 
-    cmd_compile = f"xvlog -sv {design['flags']} {design['rtl']} {design['tb']}"
-    cmd_elab = f"xelab -debug typical {design['sim_top']} -s topsim"
+    # Snapshot depends only on sources, defines, generics and the simulator install
+    sim_key = build_cache.content_key(
+        "sim", [rtl, tb],
+        (backend.name, sorted(defines), sorted(generics.items()), backend.signature(),
+         design['sim_top'], build_cache.tool_fingerprint(backend.compiler)))
 
     try:
-        subprocess.run(cmd_compile, shell=True, check=True)
-        subprocess.run(cmd_elab, shell=True, check=True)
-        
-        with open("xsim_cfg.tcl", "w") as f:
-            f.write("log_wave -recursive *\n")
-            f.write("run all\nquit\n")
+        with instrument.phase("cache_restore", design=label):
+            hit = (use_cache and build_cache.lookup(sim_key)
+                   and build_cache.restore(sim_key, backend.snapshot, work(backend.snapshot)))
+        if hit:
+            print(f"  Cache hit: reusing compiled snapshot ({sim_key[:8]})")
+        else:
+            for phase, cmd in build_cmds:
+                run_tool(cmd, phase, work_dir, opts, label)
+            if use_cache:
+                with instrument.phase("cache_store", design=label):
+                    build_cache.store(sim_key, {backend.snapshot: work(backend.snapshot)})
 
-        subprocess.run("xsim topsim -tclbatch xsim_cfg.tcl -onerror quit", 
-                      shell=True, check=True)
+        phase, cmd = backend.run_command(work_dir, plusargs or {})
+        run_tool(cmd, phase, work_dir, opts, label)
         
-        passed, count = scoreboard.verify()
+        tp_stats = None
+        mode = ("throughput" if measure_throughput else
+                "binary" if trace == "binary" else "stream" if stream else "text")
+        with instrument.phase("scoreboard", design=label, mode=mode):
+            if measure_throughput:
+                # Drivers never drop words, so ordering is the integrity check
+                tp_stats = throughput.analyze(work("throughput.txt"))
+                throughput.print_report(tp_stats)
+                passed = tp_stats["data_errors"] == 0
+                count = tp_stats["read"]["words"]
+            elif trace == "binary":
+                passed, count = scoreboard.verify_binary(work("stimulus.bin"),
+                                                         work("response.bin"), depth=depth)
+            elif stream:
+                passed, count = scoreboard.verify_stream(work("stimulus.txt"),
+                                                         work("response.txt"), depth=depth,
+                                                         max_mismatches=max_mismatches)
+            else:
+                passed, count = scoreboard.verify(work("stimulus.txt"), work("response.txt"),
+                                                  depth=depth)
         status = "PASS" if passed else "FAIL"
         
         print(f"\n  Result: {status} ({count} transactions)")
@@ -118,57 +270,23 @@ def run_simulation(design, open_waveform=False):
         
         # Open waveform viewer if requested
         if open_waveform:
-            wdb_file = "topsim.wdb"
-            if os.path.exists(wdb_file):
-                print(f"\n  Opening waveform viewer for {design['name']}...")
-                print(f"  (Close the viewer to continue)")
-                subprocess.run(f"xsim {wdb_file} -gui", shell=True)
-            else:
-                print(f"  WARNING: Waveform file not found: {wdb_file}")
+            open_waveform_viewer(design, work(backend.wave_file), backend)
         
-        return {"status": status, "transactions": count}
+        result = {"status": status, "transactions": count, "test": test, "seed": seed,
+                  "simulator": backend.name}
+        if tp_stats is not None:
+            result["throughput"] = tp_stats
+        return result
 
-    except subprocess.CalledProcessError:
+    except subprocess.CalledProcessError as e:
         print(f"  [X] Simulation CRASHED")
-        print_log_tail("xelab.log")
-        return {"status": "ERROR", "transactions": 0}
+        report_tool_failure(e, work("xelab.log"))
+        return {"status": "ERROR", "transactions": 0, "test": test, "seed": seed,
+                "simulator": backend.name}
 
-def run_synthesis(design, gen_schematic=False):
-    print(f"\n{'='*60}")
-    print(f"  SYNTHESIZING: {design['name']}")
-    print(f"{'='*60}")
-    
-    if os.path.exists("vivado.log"):
-        os.remove("vivado.log")
-
-    schematic_flag = "1" if gen_schematic else "0"
-    schematic_dir = os.path.abspath(PATHS['schematics'])
-    reports_dir = os.path.abspath(PATHS['reports'])
-    
-    cmd = (f"vivado -mode batch -source {PATHS['tcl']}/synth.tcl "
-           f"-tclargs {design['rtl']} {design['synth_top']} {schematic_flag} "
-           f"{reports_dir} {schematic_dir}")
-    
-    try:
-        with open("vivado.log", "w") as log_file:
-            subprocess.run(cmd, shell=True, check=True, 
-                          stdout=log_file, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError:
-        print(f"  [X] Synthesis FAILED")
-        print_log_tail("vivado.log", lines=30)
-        return {"lut_logic": "-", "lut_mem": "-", "ffs": "-", "wns": "-", "whs": "-", "schematic": "-"}
-    
-    results = {
-        "lut_logic": "N/A", 
-        "lut_mem": "N/A", 
-        "ffs": "N/A", 
-        "wns": "N/A",
-        "whs": "N/A",
-        "schematic": "-"
-    }
-    
-    # Parse utilization
-    util_rpt = f"{PATHS['reports']}/utilization_{design['synth_top']}.rpt"
+def parse_utilization(util_rpt):
+    """LUT/FF/BRAM counts from a report_utilization file ("N/A" if missing)."""
+    results = {"lut_logic": "N/A", "lut_mem": "N/A", "ffs": "N/A", "bram": "N/A"}
     if os.path.exists(util_rpt):
         with open(util_rpt, "r") as f:
             content = f.read()
@@ -181,9 +299,14 @@ def run_synthesis(design, gen_schematic=False):
             
             match = re.search(r"Slice Registers\s*\|\s*(\d+)", content)
             if match: results["ffs"] = match.group(1)
-    
-    # Parse timing
-    timing_rpt = f"{PATHS['reports']}/timing_{design['synth_top']}.rpt"
+            
+            match = re.search(r"Block RAM Tile\s*\|\s*([\d.]+)", content)
+            if match: results["bram"] = match.group(1)
+    return results
+
+def parse_timing(timing_rpt):
+    """WNS/WHS from the Design Timing Summary of a report_timing_summary file."""
+    results = {"wns": "N/A", "whs": "N/A"}
     if os.path.exists(timing_rpt):
         with open(timing_rpt, "r") as f:
             content = f.read()
@@ -202,9 +325,78 @@ def run_synthesis(design, gen_schematic=False):
             if match:
                 results["wns"] = match.group(1)
                 results["whs"] = match.group(3)
+    return results
+
+def run_synthesis(design, gen_schematic=False, work_dir=".", use_cache=True,
+                  generics=None, clock_period=10.0, tag=None, tool_opts=None):
+    print(f"\n{'='*60}")
+    print(f"  SYNTHESIZING: {design['name']}" + (f" [{tag}]" if tag else ""))
+    print(f"{'='*60}")
+    
+    os.makedirs(work_dir, exist_ok=True)
+    log_path = os.path.join(work_dir, "vivado.log")
+    if os.path.exists(log_path):
+        os.remove(log_path)
+
+    schematic_flag = "1" if gen_schematic else "0"
+    schematic_dir = os.path.abspath(PATHS['schematics'])
+    reports_dir = os.path.abspath(PATHS['reports'])
+    synth_tcl = os.path.abspath(f"{PATHS['tcl']}/synth.tcl")
+    rtl = os.path.abspath(design['rtl'])
+    xdc = os.path.abspath(f"{PATHS['constraints']}/timing.xdc")
+    top = design['synth_top']
+    # Sweep points write tagged reports so they never overwrite the defaults
+    tag = tag or top
+    generics = dict(design.get('generics', {}), **(generics or {}))
+    generic_arg = " ".join(f"{k}={v}" for k, v in sorted(generics.items())) or "-"
+
+    # Everything the synthesis run produces that later phases read back
+    artifacts = {
+        f"post_synth_{tag}.dcp": f"{PATHS['reports']}/post_synth_{tag}.dcp",
+        f"utilization_{tag}.rpt": f"{PATHS['reports']}/utilization_{tag}.rpt",
+        f"timing_{tag}.rpt": f"{PATHS['reports']}/timing_{tag}.rpt",
+        f"schematic_{tag}.pdf": f"{PATHS['schematics']}/schematic_{tag}.pdf",
+    }
+    synth_key = build_cache.content_key(
+        "synth", [rtl, synth_tcl, xdc],
+        (top, tag, schematic_flag, generic_arg, clock_period,
+         build_cache.tool_fingerprint("vivado")))
+
+    if use_cache:
+        with instrument.phase("cache_restore", design=tag):
+            meta = build_cache.lookup(synth_key)
+            if meta and meta.get("results"):
+                for name, path in artifacts.items():
+                    build_cache.restore(synth_key, name, path)
+        if meta and meta.get("results"):
+            results = meta["results"]
+            print(f"  Cache hit: reusing synthesis results ({synth_key[:8]})")
+            print(f"  LUT Logic: {results['lut_logic']}, LUT Mem: {results['lut_mem']}, "
+                  f"FFs: {results['ffs']}, WNS: {results['wns']}ns, WHS: {results['whs']}ns")
+            return results
+    
+    cmd = (f"vivado -mode batch -source {synth_tcl} "
+           f"-tclargs {rtl} {top} {schematic_flag} "
+           f"{reports_dir} {schematic_dir} \"{generic_arg}\" {clock_period} {tag}")
+    
+    try:
+        synth_run = run_tool(cmd, "synth", work_dir, tool_opts, tag,
+                             log_path=log_path, echo=False)
+        for warning in synth_run.warnings:
+            print(f"  {warning}")
+    except subprocess.CalledProcessError as e:
+        print(f"  [X] Synthesis FAILED")
+        report_tool_failure(e, log_path, lines=30)
+        return {"lut_logic": "-", "lut_mem": "-", "ffs": "-", "bram": "-", "wns": "-", "whs": "-", "schematic": "-"}
+    
+    results = {}
+    with instrument.phase("parse_reports", design=tag):
+        results.update(parse_utilization(f"{PATHS['reports']}/utilization_{tag}.rpt"))
+        results.update(parse_timing(f"{PATHS['reports']}/timing_{tag}.rpt"))
+    results["schematic"] = "-"
     
     # Check for schematic
-    schematic_file = f"{PATHS['schematics']}/schematic_{design['synth_top']}.pdf"
+    schematic_file = f"{PATHS['schematics']}/schematic_{tag}.pdf"
     if os.path.exists(schematic_file):
         results["schematic"] = schematic_file
         print(f"  Schematic: {schematic_file}")
@@ -212,6 +404,10 @@ def run_synthesis(design, gen_schematic=False):
     print(f"  LUT Logic: {results['lut_logic']}, LUT Mem: {results['lut_mem']}, "
           f"FFs: {results['ffs']}, WNS: {results['wns']}ns, WHS: {results['whs']}ns")
     
+    if use_cache:
+        with instrument.phase("cache_store", design=tag):
+            build_cache.store(synth_key, artifacts, results=results)
+    
     return results
 
 def main():
@@ -222,6 +418,8 @@ def main():
     
     # Create output directories
     ensure_output_dirs()
+    # Per-phase timings from this process and every pool worker
+    instrument.start(os.path.join(PATHS['work'], "trace"))
     
     # Filter designs based on argument
     if args.design == "sync":
@@ -241,9 +439,36 @@ def main():
         print("#" + " PHASE 1: FUNCTIONAL SIMULATION ".center(58) + "#")
         print("#"*60)
         
-        for name, data in results.items():
-            sim_result = run_simulation(data['design'], open_waveform=args.waveform)
-            data['sim'] = sim_result
+        sim_kwargs = {"use_cache": not args.no_cache,
+                      "stream": args.stream,
+                      "max_mismatches": args.max_mismatches,
+                      "trace": args.trace_format,
+                      "test": args.test,
+                      "seed": args.seed,
+                      "measure_throughput": args.throughput,
+                      "tool_opts": tool_options(args),
+                      "simulator": args.simulator,
+                      "sim_threads": args.sim_threads}
+        if args.jobs > 1:
+            # Each design gets its own work dir so xsim snapshots/logs never collide
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                futures = {name: pool.submit(run_simulation, data['design'],
+                                             work_dir=design_work_dir(data['design'], "sim"),
+                                             dump_waves=args.waveform, **sim_kwargs)
+                           for name, data in results.items()}
+                for name, future in futures.items():
+                    results[name]['sim'] = future.result()
+            if args.waveform:
+                for name, data in results.items():
+                    backend = simulators.get(args.simulator)
+                    wave_file = os.path.join(design_work_dir(data['design'], "sim"),
+                                             backend.wave_file)
+                    open_waveform_viewer(data['design'], wave_file, backend)
+        else:
+            for name, data in results.items():
+                sim_result = run_simulation(data['design'], open_waveform=args.waveform,
+                                            **sim_kwargs)
+                data['sim'] = sim_result
         
         # Summary after all sims
         print("\n" + "-"*60)
@@ -251,7 +476,8 @@ def main():
         for name, data in results.items():
             status = data['sim']['status']
             symbol = "[OK]" if status == "PASS" else "[FAIL]"
-            print(f"  {symbol} {name}: {status} ({data['sim']['transactions']} txns)")
+            print(f"  {symbol} {name}: {status} ({data['sim']['transactions']} txns, "
+                  f"{data['sim']['test']} seed {data['sim']['seed']})")
         print("-"*60)
     else:
         for name, data in results.items():
@@ -265,15 +491,36 @@ def main():
         print("#" + " PHASE 2: SYNTHESIS & RESOURCE ANALYSIS ".center(58) + "#")
         print("#"*60)
         
-        for name, data in results.items():
-            if data['sim']['status'] != "ERROR":
-                data['synth'] = run_synthesis(data['design'], gen_schematic=args.schematic)
-                
-                # Open GUI if requested
-                if args.gui:
-                    open_vivado_gui(data['design'])
-            else:
-                data['synth'] = {"lut_logic": "-", "lut_mem": "-", "ffs": "-", "wns": "-", "whs": "-", "schematic": "-"}
+        if args.jobs > 1:
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                futures = {name: pool.submit(run_synthesis, data['design'],
+                                             gen_schematic=args.schematic,
+                                             use_cache=not args.no_cache,
+                                             tool_opts=tool_options(args),
+                                             work_dir=design_work_dir(data['design'], "synth"))
+                           for name, data in results.items()
+                           if data['sim']['status'] != "ERROR"}
+                for name, data in results.items():
+                    if name in futures:
+                        data['synth'] = futures[name].result()
+                    else:
+                        data['synth'] = {"lut_logic": "-", "lut_mem": "-", "ffs": "-", "wns": "-", "whs": "-", "schematic": "-"}
+            if args.gui:
+                for name, data in results.items():
+                    if name in futures:
+                        open_vivado_gui(data['design'])
+        else:
+            for name, data in results.items():
+                if data['sim']['status'] != "ERROR":
+                    data['synth'] = run_synthesis(data['design'], gen_schematic=args.schematic,
+                                                  use_cache=not args.no_cache,
+                                                  tool_opts=tool_options(args))
+                    
+                    # Open GUI if requested
+                    if args.gui:
+                        open_vivado_gui(data['design'])
+                else:
+                    data['synth'] = {"lut_logic": "-", "lut_mem": "-", "ffs": "-", "wns": "-", "whs": "-", "schematic": "-"}
     else:
         # --sim-only: set placeholder synth results
         for name, data in results.items():
@@ -301,6 +548,11 @@ def main():
             if sch != '-':
                 print(f"  - {sch}")
 
+    # Keep the build cache within its size budget
+    evicted = build_cache.evict(args.cache_size_mb)
+    if evicted:
+        print(f"\nBuild cache: evicted {len(evicted)} least-recently-used entries")
+
     # Generate artifacts
     print("\nGenerating Report Artifacts...")
     try:
@@ -314,8 +566,17 @@ def main():
             "whs": data['synth']['whs']
         } for name, data in results.items()]
         
-        reporter.generate_charts(flat_results, PATHS['reports'])
-        reporter.generate_markdown(flat_results, PATHS['reports'])
+        with instrument.phase("report_charts"):
+            reporter.generate_charts(flat_results, PATHS['reports'])
+
+        events = instrument.collect()
+        timings = instrument.summarize(events)
+        instrument.write_json(events, f"{PATHS['reports']}/phase_timings.json")
+        instrument.write_chrome_trace(events, f"{PATHS['reports']}/phase_trace.json")
+        print("\nPHASE TIMINGS (open phase_trace.json in ui.perfetto.dev):")
+        instrument.print_summary(timings)
+
+        reporter.generate_markdown(flat_results, PATHS['reports'], timings=timings)
     except Exception as e:
         print(f"Failed to generate report: {e}")
 
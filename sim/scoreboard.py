@@ -1,4 +1,6 @@
 import os
+from collections import deque
+from itertools import zip_longest
 
 def verify(stim_file="stimulus.txt", resp_file="response.txt", depth=32):
     """
@@ -57,4 +59,210 @@ def verify(stim_file="stimulus.txt", resp_file="response.txt", depth=32):
             if expected_outputs[i] != actual_outputs[i]:
                 print(f"DEBUG: First mismatch at index {i}: Exp {expected_outputs[i]}, Got {actual_outputs[i]}")
                 break
-        return False, num_actual
\ No newline at end of file
+        return False, num_actual
+
+class RingBuffer:
+    """
+    Fixed-size circular buffer used as the golden FIFO model.
+    Push/pop are O(1) and memory is bounded by depth.
+    """
+    def __init__(self, depth):
+        self.depth = depth
+        self.slots = [None] * depth
+        self.head = 0       # next slot to read
+        self.count = 0
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def full(self):
+        return self.count == self.depth
+
+    def empty(self):
+        return self.count == 0
+
+    def push(self, value):
+        self.slots[(self.head + self.count) % self.depth] = value
+        self.count += 1
+
+    def pop(self):
+        value = self.slots[self.head]
+        self.head = (self.head + 1) % self.depth
+        self.count -= 1
+        return value
+
+
+def _expected_reads(stim_file, depth, history):
+    """
+    Replays the stimulus through the ring-buffer model.
+    Yields (cycle, data) for every read the golden FIFO accepts.
+    """
+    shadow_fifo = RingBuffer(depth)
+    with open(stim_file, "r") as f:
+        for cycle, line in enumerate(f):
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            history.append((cycle, line.strip()))
+            rst, wr, rd, data = parts[0], parts[1], parts[2], parts[3]
+
+            if rst == "1":
+                shadow_fifo.clear()
+            else:
+                if wr == "1" and not shadow_fifo.full():
+                    shadow_fifo.push(data.upper())
+
+                if rd == "1" and not shadow_fifo.empty():
+                    yield cycle, shadow_fifo.pop()
+
+
+def _actual_reads(resp_file):
+    """
+    Yields (line, rdata) for every valid read recorded in the response.
+    Format: wclk rst_n winc rinc wfull rempty rdata
+    """
+    with open(resp_file, "r") as f:
+        for index, line in enumerate(f):
+            parts = line.split()
+            if len(parts) < 7:
+                continue
+            if parts[3] == "1" and parts[5] == "0":
+                yield index, parts[6].upper()
+
+
+def verify_stream(stim_file="stimulus.txt", resp_file="response.txt", depth=32,
+                  max_mismatches=1, context=4):
+    """
+    Streaming variant of verify() for long traces.
+    Reads stimulus and response side by side with an O(1) ring-buffer model,
+    so memory stays bounded by depth + context regardless of trace length.
+    Stops after max_mismatches and prints the surrounding stimulus cycles.
+    Returns the same (passed, count) tuple as verify().
+    """
+    if not os.path.exists(stim_file):
+        return False, "Stimulus file missing"
+    if not os.path.exists(resp_file):
+        return False, "Response file missing (sim failed)"
+
+    history = deque(maxlen=context + 1)
+    mismatches = 0
+    count = 0
+
+    for exp, act in zip_longest(_expected_reads(stim_file, depth, history),
+                                _actual_reads(resp_file)):
+        if exp is not None and act is not None and exp[1] == act[1]:
+            count += 1
+            continue
+
+        mismatches += 1
+        if exp is None:
+            print(f"DEBUG: Extra read at response line {act[0]}: Got {act[1]} "
+                  f"(stimulus exhausted after {count} reads)")
+        elif act is None:
+            print(f"DEBUG: Missing read at stimulus cycle {exp[0]}: Exp {exp[1]} "
+                  f"(response exhausted after {count} reads)")
+        else:
+            count += 1
+            print(f"DEBUG: Mismatch #{mismatches} at index {count - 1} "
+                  f"(stimulus cycle {exp[0]}, response line {act[0]}): "
+                  f"Exp {exp[1]}, Got {act[1]}")
+        for cycle, line in history:
+            print(f"DEBUG:   cycle {cycle:>8}: {line}")
+
+        if mismatches >= max_mismatches:
+            print(f"DEBUG: Aborting after {mismatches} mismatch(es)")
+            break
+
+    return mismatches == 0, count
+
+
+def _accepted_ops(wr, rd, depth, chunk=65536):
+    """
+    Vectorized golden-model occupancy for one reset-free segment.
+    Runs cumsum over chunks and only steps single cycles where the
+    full/empty clamp actually changes the outcome.
+    Returns (accepted write mask, number of accepted reads).
+    """
+    import numpy as np
+    n = len(wr)
+    acc_wr = np.zeros(n, dtype=bool)
+    n_reads = 0
+    occ = 0
+    start = 0
+    while start < n:
+        end = min(start + chunk, n)
+        w = wr[start:end].astype(np.int64)
+        r = rd[start:end].astype(np.int64)
+        occ_after = occ + np.cumsum(w - r)
+        occ_before = np.concatenate(([occ], occ_after[:-1]))
+        blocked = ((w == 1) & (occ_before >= depth)) | ((r == 1) & (occ_before + w <= 0))
+        hits = np.flatnonzero(blocked)
+        stop = hits[0] if len(hits) else end - start
+
+        # Clean prefix: every op is accepted
+        acc_wr[start:start + stop] = w[:stop] == 1
+        n_reads += int(r[:stop].sum())
+        occ = int(occ_before[stop]) if stop < len(occ_before) else int(occ_after[-1])
+
+        if stop < end - start:
+            # Step the clamped cycle exactly like the scalar model
+            if w[stop] and occ < depth:
+                acc_wr[start + stop] = True
+                occ += 1
+            if r[stop] and occ > 0:
+                n_reads += 1
+                occ -= 1
+            stop += 1
+        start += stop
+    return acc_wr, n_reads
+
+
+def verify_binary(stim_file="stimulus.bin", resp_file="response.bin", depth=32):
+    """
+    Vectorized scoreboard for the packed binary trace format.
+    Both files are memory-mapped with numpy and compared without Python loops
+    over individual cycles. Returns the same (passed, count) tuple as verify().
+    """
+    import numpy as np
+    import trace_format
+
+    if not os.path.exists(stim_file):
+        return False, "Stimulus file missing"
+    if not os.path.exists(resp_file):
+        return False, "Response file missing (sim failed)"
+
+    stim = trace_format.open_trace(stim_file, trace_format.stim_dtype())
+    resp = trace_format.open_trace(resp_file, trace_format.resp_dtype())
+
+    # Expected: accepted writes in order, truncated per reset segment
+    resets = np.flatnonzero(stim["rst"] == 1)
+    bounds = np.concatenate(([-1], resets, [len(stim)]))
+    expected_parts = []
+    for lo, hi in zip(bounds[:-1] + 1, bounds[1:]):
+        if hi <= lo:
+            continue
+        seg = stim[lo:hi]
+        acc_wr, n_reads = _accepted_ops(seg["winc"] == 1, seg["rinc"] == 1, depth)
+        expected_parts.append(seg["data"][acc_wr][:n_reads])
+    expected_outputs = (np.concatenate(expected_parts) if expected_parts
+                        else np.zeros(0, dtype=np.uint32))
+
+    # Actual: rdata wherever a valid read was recorded
+    valid = (resp["rinc"] == 1) & (resp["rempty"] == 0)
+    actual_outputs = resp["rdata"][valid]
+
+    num_expected = len(expected_outputs)
+    num_actual = len(actual_outputs)
+
+    if num_expected == num_actual and np.array_equal(expected_outputs, actual_outputs):
+        return True, num_actual
+
+    print(f"DEBUG: Expected {num_expected} reads, got {num_actual}")
+    n = min(num_expected, num_actual)
+    diff = np.flatnonzero(expected_outputs[:n] != actual_outputs[:n])
+    if len(diff):
+        i = int(diff[0])
+        print(f"DEBUG: First mismatch at index {i}: "
+              f"Exp {int(expected_outputs[i]):02X}, Got {int(actual_outputs[i]):02X}")
+    return False, num_actual
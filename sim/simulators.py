@@ -0,0 +1,123 @@
+import os
+import shutil
+import subprocess
+
+# Simulator backends for run_simulation. Each backend turns the same RTL,
+# testbench, defines and generics into build commands, a run command and an
+# artifact the build cache can keep. tb_fifo_unified.sv and the scoreboards are
+# backend independent: every backend runs in the work dir and exchanges
+# stimulus/response files there.
+
+
+class XsimBackend:
+    """Vivado xvlog/xelab/xsim (event-driven, licensed install)."""
+    name = "xsim"
+    compiler = "xelab"                # fingerprinted for the build cache
+    snapshot = "xsim.dir"             # build output restored from the cache
+    wave_file = "topsim.wdb"
+    rules = []                        # Vivado's ERROR: lines are in DEFAULT_RULES
+
+    def __init__(self, threads=1, waveform=False):
+        self.threads = threads
+        self.waveform = waveform
+
+    def signature(self):
+        """Build options that change the snapshot, for the cache key."""
+        return ("-debug typical",)
+
+    def build_commands(self, rtl, tb, top, defines, generics):
+        opts = "".join(f" -d {d}" for d in defines)
+        elab_opts = "-debug typical" + "".join(f" -generic_top {k}={v}"
+                                               for k, v in sorted(generics.items()))
+        return [("xvlog", f"xvlog -sv{opts} {rtl} {tb}"),
+                ("xelab", f"xelab {elab_opts} {top} -s topsim")]
+
+    def run_command(self, work_dir, plusargs):
+        with open(os.path.join(work_dir, "xsim_cfg.tcl"), "w") as f:
+            f.write("log_wave -recursive *\n")
+            f.write("run all\nquit\n")
+        args = "".join(f" -testplusarg {k}={v}" for k, v in plusargs.items())
+        return "xsim", f"xsim topsim -tclbatch xsim_cfg.tcl -onerror quit{args}"
+
+    def open_waveform(self, wave_path):
+        subprocess.run(f"xsim {wave_path} -gui", shell=True)
+
+
+class IcarusBackend:
+    """Icarus Verilog (iverilog -g2012 + vvp), open source, no license."""
+    name = "icarus"
+    compiler = "iverilog"
+    snapshot = "sim.vvp"
+    wave_file = "waves.vcd"
+    rules = [(r": (error|sorry):", "fail"), (r": warning:", "warn")]
+
+    def __init__(self, threads=1, waveform=False):
+        self.threads = threads
+        self.waveform = waveform
+
+    def signature(self):
+        return ("-g2012", self.waveform)
+
+    def build_commands(self, rtl, tb, top, defines, generics):
+        opts = "".join(f" -D{d}" for d in defines)
+        if self.waveform:
+            opts += " -DDUMP_VCD"
+        opts += "".join(f" -P{top}.{k}={v}" for k, v in sorted(generics.items()))
+        return [("iverilog", f"iverilog -g2012{opts} -s {top} -o {self.snapshot} {rtl} {tb}")]
+
+    def run_command(self, work_dir, plusargs):
+        args = "".join(f" +{k}={v}" for k, v in plusargs.items())
+        return "vvp", f"vvp -n {self.snapshot}{args}"
+
+    def open_waveform(self, wave_path):
+        _open_gtkwave(wave_path)
+
+
+class VerilatorBackend:
+    """Verilator 5 (--binary --timing), compiled and optionally multi-threaded."""
+    name = "verilator"
+    compiler = "verilator"
+    snapshot = "Vtb"
+    wave_file = "waves.vcd"
+    rules = [(r"^%Error", "fail"), (r"^%Warning", "warn")]
+
+    def __init__(self, threads=1, waveform=False):
+        self.threads = max(1, threads)
+        self.waveform = waveform
+
+    def signature(self):
+        return ("--binary", self.threads, self.waveform)
+
+    def build_commands(self, rtl, tb, top, defines, generics):
+        opts = "".join(f" -D{d}" for d in defines)
+        if self.waveform:
+            opts += " -DDUMP_VCD --trace"
+        opts += "".join(f" -G{k}={v}" for k, v in sorted(generics.items()))
+        if self.threads > 1:
+            opts += f" --threads {self.threads}"
+        # -j 0: compile the generated C++ on every core; the binary lands in the work dir
+        return [("verilator", f"verilator --binary -j 0 -Wno-fatal --top-module {top}{opts} "
+                              f"--Mdir obj_dir -o ../{self.snapshot} {rtl} {tb}")]
+
+    def run_command(self, work_dir, plusargs):
+        args = "".join(f" +{k}={v}" for k, v in plusargs.items())
+        return "verilated", f"{os.path.join('.', self.snapshot)}{args}"
+
+    def open_waveform(self, wave_path):
+        _open_gtkwave(wave_path)
+
+
+def _open_gtkwave(wave_path):
+    if shutil.which("gtkwave") is None:
+        print(f"  gtkwave not found; open {wave_path} in any VCD viewer")
+        return
+    subprocess.run(["gtkwave", wave_path])
+
+
+BACKENDS = {b.name: b for b in (XsimBackend, IcarusBackend, VerilatorBackend)}
+
+
+def get(name, threads=1, waveform=False):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown simulator '{name}' (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name](threads=threads, waveform=waveform)
@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import shutil
+import argparse
+import itertools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import run_compare
+from tests import test_library
+
+DESIGN_KEYS = {"sync": "fifo_sync_top", "async": "async_fifo"}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Clock-ratio / depth sweep for FIFO sizing")
+    parser.add_argument("--design", "-d", choices=["sync", "async"], default="async",
+                        help="Design to sweep (default: async)")
+    parser.add_argument("--wclk", type=float, nargs="+", default=[10.0],
+                        help="Write clock periods in ns (default: 10)")
+    parser.add_argument("--rclk", type=float, nargs="+", default=[10.0, 15.0, 25.0, 40.0],
+                        help="Read clock periods in ns (default: 10 15 25 40)")
+    parser.add_argument("--addr-widths", type=int, nargs="+", default=[2, 3, 4, 5, 6, 7],
+                        help="ADDR_WIDTH values, depth = 2**ADDR_WIDTH (default: 2..7)")
+    parser.add_argument("--data-widths", type=int, nargs="+", default=[8],
+                        help="DATA_WIDTH values (default: 8)")
+    parser.add_argument("--test", choices=test_library.all_tests(), default="gen_burst_profile",
+                        help="Burst profile generator (default: gen_burst_profile)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-stall", type=float, default=0.0,
+                        help="Write stall %% a depth may show and still count as sustaining "
+                             "the profile (default: 0)")
+    parser.add_argument("--simulator", choices=list(run_compare.simulators.BACKENDS),
+                        default="xsim", help="Simulation backend (default: xsim)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Parallel simulations (default: CPU count)")
+    parser.add_argument("--out", default=f"{run_compare.PATHS['reports']}/sweep_results.json",
+                        help="JSON results file")
+    return parser.parse_args()
+
+
+def run_point(design, point, test, seed, work_dir, simulator="xsim"):
+    """Worker: one throughput simulation for a (width, depth, clock) point."""
+    os.makedirs(work_dir, exist_ok=True)
+    generics = {"ADDR_WIDTH": point['addr_width'], "DATA_WIDTH": point['data_width']}
+    plusargs = {"WCLK_PERIOD": point['wclk'], "RCLK_PERIOD": point['rclk']}
+    with open(os.path.join(work_dir, "sim.log"), "w") as log, \
+            contextlib.redirect_stdout(log):
+        result = run_compare.run_simulation(design, work_dir=work_dir, test=test, seed=seed,
+                                            measure_throughput=True,
+                                            generics=generics, plusargs=plusargs,
+                                            simulator=simulator)
+    row = dict(point, status=result['status'])
+    tp = result.get("throughput")
+    if tp:
+        row.update({
+            "write_words_per_cycle": tp['write']['words_per_cycle'],
+            "read_words_per_cycle": tp['read']['words_per_cycle'],
+            "mwords_per_s": tp['words_per_ns'] * 1000,
+            "write_stall_pct": tp['write']['stall_pct'],
+            "read_stall_pct": tp['read']['stall_pct'],
+            "max_occupancy": tp['max_occupancy'],
+            "latency_mean_ns": tp['latency_ns']['mean'],
+        })
+    if row['status'] == "PASS":
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return row
+
+
+def smallest_depths(rows, max_stall):
+    """Per clock pair / width: the smallest depth whose write side never stalls beyond max_stall."""
+    best = {}
+    for row in rows:
+        if row['status'] != "PASS" or row.get('write_stall_pct', 100.0) > max_stall:
+            continue
+        key = (row['wclk'], row['rclk'], row['data_width'])
+        if key not in best or row['depth'] < best[key]:
+            best[key] = row['depth']
+    return best
+
+
+def print_table(rows):
+    print(f"{'WCLK':>6} | {'RCLK':>6} | {'DW':>3} | {'DEPTH':>5} | {'SIM':<6} | "
+          f"{'W w/cyc':>7} | {'R w/cyc':>7} | {'Mw/s':>6} | {'WStall%':>7} | {'MaxOcc':>6}")
+    print("-"*90)
+    for r in rows:
+        if "mwords_per_s" not in r:
+            print(f"{r['wclk']:>6} | {r['rclk']:>6} | {r['data_width']:>3} | {r['depth']:>5} | "
+                  f"{r['status']:<6} |")
+            continue
+        print(f"{r['wclk']:>6} | {r['rclk']:>6} | {r['data_width']:>3} | {r['depth']:>5} | "
+              f"{r['status']:<6} | {r['write_words_per_cycle']:>7.3f} | "
+              f"{r['read_words_per_cycle']:>7.3f} | {r['mwords_per_s']:>6.1f} | "
+              f"{r['write_stall_pct']:>7.1f} | {r['max_occupancy']:>6}")
+
+
+def main():
+    args = parse_args()
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    run_compare.ensure_output_dirs()
+
+    design = next(d for d in run_compare.DESIGNS if d['synth_top'] == DESIGN_KEYS[args.design])
+    # The sync FIFO has a single clock, so only wclk is swept
+    rclks = args.rclk if args.design == "async" else [None]
+
+    points = []
+    for aw, dw, wclk, rclk in itertools.product(args.addr_widths, args.data_widths,
+                                                args.wclk, rclks):
+        points.append({"addr_width": aw, "depth": 1 << aw, "data_width": dw,
+                       "wclk": wclk, "rclk": rclk if rclk is not None else wclk})
+
+    print(f"Sweep: {len(points)} points on {args.jobs} workers "
+          f"({args.design}, {args.test}, seed {args.seed})")
+    rows = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {}
+        for p in points:
+            work_dir = os.path.join(run_compare.PATHS['work'], "sweep", design['synth_top'],
+                                    f"aw{p['addr_width']}_dw{p['data_width']}"
+                                    f"_w{p['wclk']:g}_r{p['rclk']:g}")
+            futures[pool.submit(run_point, design, p, args.test, args.seed, work_dir,
+                                args.simulator)] = p
+        for i, future in enumerate(as_completed(futures), 1):
+            try:
+                row = future.result()
+            except Exception as e:
+                row = dict(futures[future], status="ERROR", error=str(e))
+            rows.append(row)
+            print(f"  [{i}/{len(points)}] depth {row['depth']} wclk {row['wclk']} "
+                  f"rclk {row['rclk']}: {row['status']}")
+
+    rows.sort(key=lambda r: (r['wclk'], r['rclk'], r['data_width'], r['depth']))
+    print()
+    print_table(rows)
+
+    best = smallest_depths(rows, args.max_stall)
+    print(f"\nSmallest depth sustaining '{args.test}' (write stall <= {args.max_stall}%):")
+    for wclk, rclk, dw in sorted({(r['wclk'], r['rclk'], r['data_width']) for r in rows}):
+        depth = best.get((wclk, rclk, dw))
+        label = depth if depth is not None else f"> {1 << max(args.addr_widths)}"
+        print(f"  wclk {wclk}ns / rclk {rclk}ns (ratio {rclk / wclk:.2f}), DW {dw}: {label}")
+
+    with open(args.out, "w") as f:
+        json.dump({"test": args.test, "seed": args.seed, "max_stall": args.max_stall,
+                   "points": rows}, f, indent=2)
+    print(f"\nSaved: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import os
+import sys
+import json
+import argparse
+import itertools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import run_compare
+import reporter
+
+DESIGN_KEYS = {"sync": "fifo_sync_top", "async": "async_fifo"}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Synthesis QoR sweep over depth, width and clock")
+    parser.add_argument("--design", "-d", choices=["sync", "async", "all"], default="all",
+                        help="Which design to sweep (default: all)")
+    parser.add_argument("--addr-widths", type=int, nargs="+", default=[3, 4, 5, 6, 7, 8, 9, 10],
+                        help="ADDR_WIDTH values, depth = 2**ADDR_WIDTH (default: 3..10)")
+    parser.add_argument("--data-widths", type=int, nargs="+", default=[8, 16, 32],
+                        help="DATA_WIDTH values (default: 8 16 32)")
+    parser.add_argument("--periods", type=float, nargs="+", default=[10.0],
+                        help="Target clock periods in ns (default: 10)")
+    parser.add_argument("--jobs", "-j", type=int, default=4,
+                        help="Vivado jobs per batch; each needs several GB of RAM (default: 4)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-synthesize points already in the build cache")
+    return parser.parse_args()
+
+
+def synth_point(design, point, use_cache):
+    """Worker: synthesize one parameter point with tagged reports in its own work dir."""
+    tag = (f"{design['synth_top']}_aw{point['addr_width']}_dw{point['data_width']}"
+           f"_p{point['period']:g}")
+    work_dir = os.path.join(run_compare.PATHS['work'], "synth_sweep", tag)
+    os.makedirs(work_dir, exist_ok=True)
+    generics = {"ADDR_WIDTH": point['addr_width'], "DATA_WIDTH": point['data_width']}
+    with open(os.path.join(work_dir, "sweep.log"), "w") as log, \
+            contextlib.redirect_stdout(log):
+        results = run_compare.run_synthesis(design, work_dir=work_dir, use_cache=use_cache,
+                                            generics=generics, clock_period=point['period'],
+                                            tag=tag)
+    return dict(point, design=design['name'], tag=tag, **results)
+
+
+def main():
+    args = parse_args()
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    run_compare.ensure_output_dirs()
+
+    if args.design == "all":
+        designs = run_compare.DESIGNS
+    else:
+        designs = [d for d in run_compare.DESIGNS if d['synth_top'] == DESIGN_KEYS[args.design]]
+
+    points = [{"addr_width": aw, "depth": 1 << aw, "data_width": dw, "period": p}
+              for aw, dw, p in itertools.product(args.addr_widths, args.data_widths, args.periods)]
+    jobs = [(d, p) for d in designs for p in points]
+    print(f"Synthesis sweep: {len(jobs)} runs, {args.jobs} Vivado jobs at a time")
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(synth_point, d, p, not args.no_cache): (d, p) for d, p in jobs}
+        for i, future in enumerate(as_completed(futures), 1):
+            design, point = futures[future]
+            try:
+                row = future.result()
+            except Exception as e:
+                row = dict(point, design=design['name'], error=str(e))
+            rows.append(row)
+            print(f"  [{i}/{len(jobs)}] {row['design']} depth={row['depth']} "
+                  f"DW={row['data_width']} {row['period']}ns: LUT {row.get('lut_logic', '-')}"
+                  f"+{row.get('lut_mem', '-')} FF {row.get('ffs', '-')} "
+                  f"BRAM {row.get('bram', '-')} WNS {row.get('wns', '-')}")
+
+    reports_dir = run_compare.PATHS['reports']
+    with open(os.path.join(reports_dir, "synth_sweep.json"), "w") as f:
+        json.dump(rows, f, indent=2)
+
+    crossovers = reporter.find_crossovers(rows)
+    print("\nCrossover points:")
+    for c in crossovers:
+        print(f"  {c['design']:<12} DW={c['data_width']:<3} {c['period']}ns: "
+              f"timing fails at depth {c['timing_fail_depth'] or '-'}, "
+              f"BRAM from depth {c['bram_depth'] or '-'}")
+
+    try:
+        charts = reporter.generate_scaling_curves(rows, reports_dir)
+        reporter.generate_sweep_markdown(rows, crossovers, charts, reports_dir)
+    except Exception as e:
+        print(f"Failed to generate report: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,58 @@
 # Arguments: rtl_file top_module gen_schematic reports_dir schematics_dir
+#            [generics] [clock_period] [report_tag]
+#   generics:     space separated NAME=VALUE list, "-" for defaults
+#   clock_period: target period in ns (default 10.0)
+#   report_tag:   suffix for report/checkpoint names (default top_module)
 set rtl_file [lindex $argv 0]
 set top_module [lindex $argv 1]
 set gen_schematic [lindex $argv 2]
 set reports_dir [lindex $argv 3]
 set schematics_dir [lindex $argv 4]
+set generics [lindex $argv 5]
+set clock_period [lindex $argv 6]
+set report_tag [lindex $argv 7]
+
+if {$clock_period eq ""} { set clock_period 10.0 }
+if {$report_tag eq ""} { set report_tag $top_module }
 
 set part_name "xc7a35tcpg236-1"
 
+# Build -generic options for parameter sweeps
+set generic_opts {}
+if {$generics ne "" && $generics ne "-"} {
+    foreach g [split $generics " "] {
+        if {$g ne ""} { lappend generic_opts -generic $g }
+    }
+}
+
+# "PHASE: <name>" lines let run_compare.py time each step of the batch run
 # Read and synthesize
+puts "PHASE: read"
 read_verilog -sv $rtl_file
-synth_design -top $top_module -part $part_name -mode out_of_context
+puts "PHASE: synth_design"
+synth_design -top $top_module -part $part_name -mode out_of_context {*}$generic_opts
 
+puts "PHASE: write_checkpoint"
 # Save checkpoint for later GUI/schematic use
-write_checkpoint -force "${reports_dir}/post_synth_${top_module}.dcp"
+write_checkpoint -force "${reports_dir}/post_synth_${report_tag}.dcp"
 
 # Generate reports with unique names
-report_utilization -file "${reports_dir}/utilization_${top_module}.rpt"
+puts "PHASE: reports"
+report_utilization -file "${reports_dir}/utilization_${report_tag}.rpt"
 
 # Create clock and timing report
-create_clock -name sys_clk -period 10.0 [get_ports *clk*]
-report_timing_summary -file "${reports_dir}/timing_${top_module}.rpt"
+create_clock -name sys_clk -period $clock_period [get_ports *clk*]
+report_timing_summary -file "${reports_dir}/timing_${report_tag}.rpt"
 
 # Optional schematic generation
 if {$gen_schematic eq "1"} {
+    puts "PHASE: schematic"
     puts "Generating schematic PDF..."
     show_schematic [get_cells -hierarchical]
     write_schematic -format pdf -orientation landscape \
-        -scope visible -force "${schematics_dir}/schematic_${top_module}.pdf"
-    puts "Schematic saved to: ${schematics_dir}/schematic_${top_module}.pdf"
+        -scope visible -force "${schematics_dir}/schematic_${report_tag}.pdf"
+    puts "Schematic saved to: ${schematics_dir}/schematic_${report_tag}.pdf"
 }
 
-puts "Synthesis complete for ${top_module}"
\ No newline at end of file
+puts "PHASE: done"
+puts "Synthesis complete for ${report_tag}"
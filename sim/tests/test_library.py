@@ -1,4 +1,5 @@
 import random
+import inspect
 
 def gen_empty_stress(f, depth=32):
     """ Checks if the FIFO handles a 'Read-while-empty' correctly."""
@@ -27,7 +28,7 @@ def gen_full_stress(f, depth=32):
     for _ in range(depth):
         f.write("0 0 1 00\n")
 
-def gen_simultaneous_burst(f, depth=32):
+def gen_simultaneous_burst(f, depth=32, rng=random):
     """Stress tests simultaneous Read and Write (High Bandwidth)."""
     f.write("1 0 0 00\n")
     f.write("0 0 0 00\n")
@@ -36,4 +37,64 @@ def gen_simultaneous_burst(f, depth=32):
         f.write(f"0 1 0 {i:02X}\n")
     # 100 cycles of both WR and RD active
     for i in range(100):
-        f.write(f"0 1 1 {random.randint(0,255):02X}\n")
\ No newline at end of file
+        f.write(f"0 1 1 {rng.randint(0,255):02X}\n")
+
+def gen_random_bursts(f, depth=32, rng=random, bursts=20):
+    """Alternating write and read bursts of random length (0 .. 2*depth)."""
+    f.write("1 0 0 00\n")
+    f.write("0 0 0 00\n")
+    for _ in range(bursts):
+        for _ in range(rng.randint(0, 2 * depth)):
+            f.write(f"0 1 0 {rng.randint(0,255):02X}\n")
+        for _ in range(rng.randint(0, 2 * depth)):
+            f.write("0 0 1 00\n")
+
+def gen_duty_cycle(f, depth=32, rng=random, cycles=500):
+    """Independent random read/write enables with a per-seed duty cycle."""
+    wr_duty = rng.choice([0.1, 0.25, 0.5, 0.75, 0.9])
+    rd_duty = rng.choice([0.1, 0.25, 0.5, 0.75, 0.9])
+    f.write("1 0 0 00\n")
+    f.write("0 0 0 00\n")
+    for _ in range(cycles):
+        wr = int(rng.random() < wr_duty)
+        rd = int(rng.random() < rd_duty)
+        f.write(f"0 {wr} {rd} {rng.randint(0,255):02X}\n")
+
+def gen_reset_mid_traffic(f, depth=32, rng=random, segments=4):
+    """Random traffic interrupted by resets while the FIFO is partly full."""
+    for _ in range(segments):
+        f.write("1 0 0 00\n")
+        f.write("0 0 0 00\n")
+        for _ in range(rng.randint(depth // 2, 3 * depth)):
+            wr = int(rng.random() < 0.6)
+            rd = int(rng.random() < 0.4)
+            f.write(f"0 {wr} {rd} {rng.randint(0,255):02X}\n")
+
+def gen_burst_profile(f, depth=32, rng=random, burst=64, gap=64, bursts=8):
+    """Periodic write bursts against a continuously requesting reader (FIFO sizing)."""
+    f.write("1 0 0 00\n")
+    f.write("0 0 0 00\n")
+    for _ in range(bursts):
+        for _ in range(burst):
+            f.write(f"0 1 1 {rng.randint(0,255):02X}\n")
+        for _ in range(gap):
+            f.write("0 0 1 00\n")
+
+def all_tests():
+    """Every gen_* generator in this module, in definition order."""
+    return [name for name, fn in globals().items()
+            if name.startswith("gen_") and inspect.isfunction(fn)]
+
+def is_randomized(name):
+    """Generators taking an rng produce different stimulus per seed."""
+    return "rng" in inspect.signature(globals()[name]).parameters
+
+def generate(f, name, seed=None, depth=32):
+    """
+    Write stimulus for test `name`. Randomized tests get their own
+    random.Random(seed) so a recorded seed replays the exact stimulus.
+    """
+    gen = globals()[name]
+    if is_randomized(name):
+        return gen(f, depth, rng=random.Random(seed))
+    return gen(f, depth)
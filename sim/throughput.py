@@ -0,0 +1,127 @@
+import os
+import sys
+import argparse
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def parse_log(log_file="throughput.txt"):
+    """
+    Reads the THROUGHPUT_MODE transaction log.
+    Lines: "W|R <time_ns> <request_cycle> <stall_cycles> <data>", '#' lines are headers.
+    """
+    header = {}
+    writes, reads = [], []
+    with open(log_file, "r") as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == "#":
+                header[parts[1]] = float(parts[2])
+                continue
+            if len(parts) < 5:
+                continue
+            rec = (float(parts[1]), int(parts[2]), int(parts[3]), parts[4].upper())
+            if parts[0] == "W":
+                writes.append(rec)
+            elif parts[0] == "R":
+                reads.append(rec)
+    return header, writes, reads
+
+
+def _domain_stats(txns):
+    """Words/cycle, stall cycles and stall % for one side of the FIFO."""
+    if not txns:
+        return {"words": 0, "cycles": 0, "words_per_cycle": 0.0,
+                "stall_cycles": 0, "stall_pct": 0.0}
+    first_req = txns[0][1]
+    last_acc = txns[-1][1] + txns[-1][2]
+    cycles = max(1, last_acc - first_req + 1)
+    stalls = sum(stall for _, _, stall, _ in txns)
+    return {"words": len(txns), "cycles": cycles,
+            "words_per_cycle": len(txns) / cycles,
+            "stall_cycles": stalls, "stall_pct": 100.0 * stalls / cycles}
+
+
+def max_occupancy(writes, reads):
+    """Peak words held, replaying accepted writes/reads in time order."""
+    events = sorted([(t, 0, -1) for t, _, _, _ in reads] +
+                    [(t, 1, +1) for t, _, _, _ in writes])
+    occ = peak = 0
+    for _, _, delta in events:
+        occ += delta
+        peak = max(peak, occ)
+    return peak
+
+
+def analyze(log_file="throughput.txt"):
+    """
+    Sustained bandwidth, per-word CDC latency and stall rates.
+    Words are matched in FIFO order: the i-th read returns the i-th write.
+    """
+    header, writes, reads = parse_log(log_file)
+    wper = header.get("wclk_period", 10.0)
+    rper = header.get("rclk_period", wper)
+
+    pairs = list(zip(writes, reads))
+    latencies = [r[0] - w[0] for w, r in pairs]
+    errors = [i for i, (w, r) in enumerate(pairs) if w[3] != r[3]]
+
+    span = (max(writes[-1][0] if writes else 0, reads[-1][0] if reads else 0)
+            - min(writes[0][0] if writes else 0, reads[0][0] if reads else 0))
+
+    stats = {
+        "depth": int(header.get("depth", 0)),
+        "wclk_period": wper,
+        "rclk_period": rper,
+        "write": _domain_stats(writes),
+        "read": _domain_stats(reads),
+        "words_per_ns": len(pairs) / span if span > 0 else 0.0,
+        "latency_ns": {
+            "min": min(latencies) if latencies else 0.0,
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": _percentile(latencies, 50),
+            "p99": _percentile(latencies, 99),
+            "max": max(latencies) if latencies else 0.0,
+        },
+        "data_errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "unread_words": len(writes) - len(pairs),
+        "max_occupancy": max_occupancy(writes, reads),
+    }
+    return stats
+
+
+def print_report(stats):
+    lat = stats["latency_ns"]
+    w, r = stats["write"], stats["read"]
+    print(f"  Depth {stats['depth']}, wclk {stats['wclk_period']}ns, rclk {stats['rclk_period']}ns")
+    print(f"  {'Domain':<8} | {'Words':>7} | {'Cycles':>8} | {'Words/cyc':>9} | {'Stall %':>7}")
+    print(f"  {'write':<8} | {w['words']:>7} | {w['cycles']:>8} | "
+          f"{w['words_per_cycle']:>9.3f} | {w['stall_pct']:>7.1f}")
+    print(f"  {'read':<8} | {r['words']:>7} | {r['cycles']:>8} | "
+          f"{r['words_per_cycle']:>9.3f} | {r['stall_pct']:>7.1f}")
+    print(f"  Sustained: {stats['words_per_ns'] * 1000:.1f} Mwords/s, "
+          f"peak occupancy {stats['max_occupancy']}/{stats['depth']}")
+    print(f"  CDC latency (ns): min {lat['min']:.1f}, mean {lat['mean']:.1f}, "
+          f"p99 {lat['p99']:.1f}, max {lat['max']:.1f}")
+    print(f"  CDC latency (cycles): mean {lat['mean'] / stats['wclk_period']:.2f} wclk, "
+          f"{lat['mean'] / stats['rclk_period']:.2f} rclk")
+    if stats["data_errors"]:
+        print(f"  WARNING: {stats['data_errors']} data mismatches, first at word {stats['first_error']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze a THROUGHPUT_MODE transaction log")
+    parser.add_argument("log", nargs="?", default="throughput.txt")
+    args = parser.parse_args()
+    if not os.path.exists(args.log):
+        sys.exit(f"Log not found: {args.log}")
+    print_report(analyze(args.log))
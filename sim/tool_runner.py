@@ -0,0 +1,221 @@
+import os
+import re
+import sys
+import time
+import queue
+import signal
+import threading
+import subprocess
+from collections import deque
+
+# (pattern, action) checked against every output line as it is produced.
+#   fail -> kill the tool immediately, the run is reported as failed
+#   warn -> keep running, the line is kept in the result for the report
+DEFAULT_RULES = [
+    (r"^\s*(FATAL_)?ERROR:", "fail"),
+    (r"^\s*CRITICAL WARNING:", "warn"),
+    (r"Timing constraints are not met", "warn"),
+]
+
+# Tool scripts print "PHASE: <name>" to mark sub-phases for timing (see synth.tcl)
+MARK_PREFIX = "PHASE: "
+
+# Wall-clock limits per phase in seconds (None = unlimited)
+DEFAULT_TIMEOUTS = {
+    "xvlog": 300,
+    "xelab": 600,
+    "xsim": 3600,
+    "iverilog": 300,
+    "vvp": 3600,
+    "verilator": 1800,        # C++ generation and build
+    "verilated": 3600,        # the compiled model
+    "synth": 3600,
+}
+
+
+class ToolError(subprocess.CalledProcessError):
+    """Raised by run_tool(check=True); carries the ToolResult for reporting."""
+    def __init__(self, result):
+        super().__init__(result.returncode, result.cmd)
+        self.result = result
+
+    def __str__(self):
+        return f"{self.result.phase} {self.result.status}: {self.result.reason}"
+
+
+class ToolResult:
+    def __init__(self, cmd, phase, tail_lines):
+        self.cmd = cmd
+        self.phase = phase
+        self.returncode = None
+        self.status = "ok"          # ok | failed | killed | timeout
+        self.reason = ""
+        self.warnings = []
+        self.tail = deque(maxlen=tail_lines)
+        self.elapsed = 0.0
+        self.start_ts = None          # epoch seconds, for timeline export
+        self.end_ts = None
+        self.marks = []               # (epoch seconds, sub-phase name)
+        self.cpu_s = None             # user+sys of the tool, when the OS reports it
+        self.max_rss_kb = None
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+
+def build_rules(fail_on_critical=False, fail_on_timing=False):
+    """DEFAULT_RULES with critical warnings / timing failures optionally made fatal."""
+    rules = []
+    for pattern, action in DEFAULT_RULES:
+        if (fail_on_critical and "CRITICAL" in pattern) or (fail_on_timing and "Timing" in pattern):
+            action = "fail"
+        rules.append((pattern, action))
+    return rules
+
+
+def compile_rules(rules):
+    return [(re.compile(pattern), action) for pattern, action in rules]
+
+
+def _kill_tree(proc):
+    """Kill the shell and every tool process it started."""
+    if proc.poll() is not None:
+        return
+    try:
+        if os.name == "nt":
+            subprocess.run(f"taskkill /F /T /PID {proc.pid}", shell=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+    except (OSError, ProcessLookupError):
+        proc.kill()
+
+
+def _reap(proc, result, timeout=30):
+    """
+    Wait for the shell and keep its rusage, which covers the tool it ran.
+    ru_maxrss never reads below the Python process size the shell was forked from.
+    Falls back to Popen.wait where wait4 is unavailable.
+    """
+    if not hasattr(os, "wait4"):
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        return
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while True:
+        try:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+        except ChildProcessError:
+            proc.wait()
+            return
+        if pid:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            result.cpu_s = usage.ru_utime + usage.ru_stime
+            result.max_rss_kb = usage.ru_maxrss
+            return
+        if time.monotonic() > deadline:
+            proc.kill()
+            deadline = float("inf")
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
+
+def _pump(stream, lines):
+    try:
+        for line in iter(stream.readline, ""):
+            lines.put(line)
+    except (OSError, ValueError):
+        pass
+    lines.put(None)
+
+
+def run_tool(cmd, phase, cwd=".", log_path=None, rules=None, timeout=None,
+             echo=True, tail_lines=40, check=False, max_warnings=20):
+    """
+    Run a tool and classify its output while it streams.
+    A 'fail' rule match or the phase timeout kills the job immediately instead
+    of waiting for the tool to exit. Only the last tail_lines lines are kept
+    in memory; the full output goes to log_path when given.
+    """
+    rules = compile_rules(rules if rules is not None else DEFAULT_RULES)
+    if timeout is None:
+        timeout = DEFAULT_TIMEOUTS.get(phase)
+    result = ToolResult(cmd, phase, tail_lines)
+
+    popen_kwargs = {}
+    if os.name != "nt":
+        popen_kwargs["start_new_session"] = True   # own process group for _kill_tree
+    proc = subprocess.Popen(cmd, shell=True, cwd=cwd, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True, errors="replace",
+                            bufsize=1, **popen_kwargs)
+    lines = queue.Queue()
+    reader = threading.Thread(target=_pump, args=(proc.stdout, lines), daemon=True)
+    reader.start()
+
+    log = open(log_path, "w") if log_path else None
+    start = time.monotonic()
+    result.start_ts = time.time()
+    try:
+        while True:
+            remaining = None if timeout is None else timeout - (time.monotonic() - start)
+            if remaining is not None and remaining <= 0:
+                result.status = "timeout"
+                result.reason = f"exceeded {timeout}s limit"
+                _kill_tree(proc)
+                break
+            try:
+                line = lines.get(timeout=min(remaining, 1.0) if remaining is not None else 1.0)
+            except queue.Empty:
+                continue
+            if line is None:
+                break
+
+            if log:
+                log.write(line)
+            if echo:
+                sys.stdout.write(line)
+            result.tail.append(line.rstrip("\n"))
+            if line.startswith(MARK_PREFIX):
+                result.marks.append((time.time(), line[len(MARK_PREFIX):].strip()))
+
+            for pattern, action in rules:
+                if pattern.search(line):
+                    if action == "fail":
+                        result.status = "killed"
+                        result.reason = line.strip()
+                    elif len(result.warnings) < max_warnings:
+                        result.warnings.append(line.strip())
+                    break
+            if result.status == "killed":
+                _kill_tree(proc)
+                break
+    finally:
+        if log:
+            log.close()
+        _reap(proc, result)
+        reader.join(timeout=5)
+        proc.stdout.close()
+        result.elapsed = time.monotonic() - start
+        result.end_ts = time.time()
+
+    result.returncode = proc.returncode
+    if result.status == "ok" and proc.returncode != 0:
+        result.status = "failed"
+        result.reason = f"exit code {proc.returncode}"
+
+    if check and not result.ok:
+        raise ToolError(result)
+    return result
+
+
+def print_tail(result, lines=20):
+    """Failure report from the in-memory ring buffer, no log re-read."""
+    print(f"\n--- {result.phase} {result.status.upper()}: {result.reason} ---")
+    for line in list(result.tail)[-lines:]:
+        print(line)
+    print("----------------------------\n")
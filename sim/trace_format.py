@@ -0,0 +1,74 @@
+import os
+import struct
+
+# Packed big-endian records shared with tb_fifo_unified.sv (BINARY_TRACE)
+#   stimulus: rst winc rinc pad data(u32)                      -> 8 bytes
+#   response: clk rst_n winc rinc wfull rempty pad pad rdata(u32) -> 12 bytes
+STIM_STRUCT = struct.Struct(">BBBxI")
+RESP_STRUCT = struct.Struct(">BBBBBBxxI")
+
+STIM_FIELDS = [("rst", "u1"), ("winc", "u1"), ("rinc", "u1"), ("pad", "u1"),
+               ("data", ">u4")]
+RESP_FIELDS = [("clk", "u1"), ("rst_n", "u1"), ("winc", "u1"), ("rinc", "u1"),
+               ("wfull", "u1"), ("rempty", "u1"), ("pad", "u2"),
+               ("rdata", ">u4")]
+
+
+class BinaryStimulusWriter:
+    """
+    File-like adapter so test_library generators can emit binary stimulus.
+    Accepts the usual "rst winc rinc data\\n" text lines and packs them.
+    """
+    def __init__(self, raw):
+        self.raw = raw
+        self.pending = ""
+
+    def write(self, text):
+        self.pending += text
+        *lines, self.pending = self.pending.split("\n")
+        for line in lines:
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            self.raw.write(STIM_STRUCT.pack(int(parts[0]), int(parts[1]),
+                                            int(parts[2]), int(parts[3], 16)))
+
+
+def stim_dtype():
+    import numpy as np
+    return np.dtype(STIM_FIELDS)
+
+
+def resp_dtype():
+    import numpy as np
+    return np.dtype(RESP_FIELDS)
+
+
+def open_trace(path, dtype):
+    """Memory-map a binary trace; empty files map to an empty array."""
+    import numpy as np
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+def stim_to_text(bin_file, txt_file):
+    """Dump a binary stimulus file in the text format for debugging."""
+    with open(bin_file, "rb") as fin, open(txt_file, "w") as fout:
+        for rst, wr, rd, data in STIM_STRUCT.iter_unpack(fin.read()):
+            fout.write(f"{rst} {wr} {rd} {data:02X}\n")
+
+
+def resp_to_text(bin_file, txt_file):
+    """Dump a binary response file in the text format for debugging."""
+    with open(bin_file, "rb") as fin, open(txt_file, "w") as fout:
+        for clk, rst_n, wr, rd, full, empty, data in RESP_STRUCT.iter_unpack(fin.read()):
+            fout.write(f"{clk} {rst_n} {wr} {rd} {full} {empty} {data:02x}\n")
+
+
+def text_to_stim(txt_file, bin_file):
+    """Convert a text stimulus file to the binary format."""
+    with open(txt_file, "r") as fin, open(bin_file, "wb") as fout:
+        writer = BinaryStimulusWriter(fout)
+        for line in fin:
+            writer.write(line)
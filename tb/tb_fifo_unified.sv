@@ -2,6 +2,18 @@
 module tb_fifo_unified;
     parameter DATA_WIDTH = 8;
     parameter ADDR_WIDTH = 5;
+    parameter real WCLK_PERIOD = 10.0;  // 100 MHz
+    parameter real RCLK_PERIOD = 25.0;  // 40 MHz (async only)
+
+    // Clock periods can be overridden at run time without re-elaborating:
+    //   xsim topsim -testplusarg WCLK_PERIOD=8 -testplusarg RCLK_PERIOD=33.3
+    //   vvp sim.vvp +WCLK_PERIOD=8 +RCLK_PERIOD=33.3   (Icarus; Verilator alike)
+    real wclk_period = WCLK_PERIOD;
+    real rclk_period = RCLK_PERIOD;
+    initial begin
+        void'($value$plusargs("WCLK_PERIOD=%f", wclk_period));
+        void'($value$plusargs("RCLK_PERIOD=%f", rclk_period));
+    end
     
     logic wclk, rclk;
     logic rst_n;       
@@ -12,8 +24,8 @@ module tb_fifo_unified;
 
     `ifdef ASYNC_MODE
         initial $display("--- TESTING ASYNC FIFO ---");
-        initial wclk = 0; always #5    wclk = ~wclk;
-        initial rclk = 0; always #12.5 rclk = ~rclk;
+        initial begin wclk = 0; #0; forever #(wclk_period/2) wclk = ~wclk; end
+        initial begin rclk = 0; #0; forever #(rclk_period/2) rclk = ~rclk; end
         
         async_fifo #(
             .DATA_WIDTH(DATA_WIDTH), .ADDR_WIDTH(ADDR_WIDTH)
@@ -23,7 +35,7 @@ module tb_fifo_unified;
         );
     `else
         initial $display("--- TESTING SYNC FIFO ---");
-        initial wclk = 0; always #5 wclk = ~wclk; 
+        initial begin wclk = 0; #0; forever #(wclk_period/2) wclk = ~wclk; end
         assign rclk = wclk; 
         
         fifo_sync_top #(
@@ -35,67 +47,222 @@ module tb_fifo_unified;
         );
     `endif
 
+    `ifdef DUMP_VCD
+        // xsim logs waves through its Tcl config; Icarus/Verilator dump VCD
+        initial begin
+            $dumpfile("waves.vcd");
+            $dumpvars(0, tb_fifo_unified);
+        end
+    `endif
+
     integer f_in, f_out, scan_res;
     logic f_rst, f_wr, f_rd;
-    logic [7:0] f_data_val;
-    
+    logic [DATA_WIDTH-1:0] f_data_val;
+
+    `ifdef BINARY_TRACE
+        // Packed records, see sim/trace_format.py
+        //   stimulus: rst(8) winc(8) rinc(8) pad(8) data(32)           = 8 bytes
+        //   response: clk rst_n winc rinc wfull rempty pad pad (8 each)
+        //             rdata(32)                                        = 12 bytes
+        localparam int STIM_CHUNK = 4096;
+        logic [63:0] stim_mem [0:STIM_CHUNK-1];
+        integer n_bytes, n_records, rec;
+    `endif
+
+    `ifdef THROUGHPUT_MODE
+        // Independent write/read drivers, see sim/throughput.py
+        // Each stimulus line is one request slot in each clock domain.
+        // Log lines: "W|R <time_ns> <request_cycle> <stall_cycles> <data>"
+        logic       tp_wr_q[$], tp_rd_q[$];
+        logic [DATA_WIDTH-1:0] tp_data_q[$];
+        longint     wcycle = 0, rcycle = 0;
+        integer     f_tp;
+
+        always @(posedge wclk) wcycle++;
+        always @(posedge rclk) rcycle++;
+
+        // Progress watchdog: both drivers blocked means the stimulus ran out
+        // of reads (or writes) for the other side, not a DUT hang
+        bit  w_done = 0, r_done = 0;
+        real last_progress = 0;
+
+        // Write side: present each word, hold it until wfull allows the write
+        task automatic write_driver();
+            longint req, stall;
+            foreach (tp_wr_q[i]) begin
+                @(negedge wclk);
+                last_progress = $realtime;
+                winc  = tp_wr_q[i];
+                wdata = tp_data_q[i];
+                if (tp_wr_q[i]) begin
+                    req   = wcycle;
+                    stall = 0;
+                    forever begin
+                        @(posedge wclk);
+                        if (!wfull) break;   // pre-edge flag decides acceptance
+                        stall++;
+                    end
+                    $fwrite(f_tp, "W %0.3f %0d %0d %h\n", $realtime, req, stall, wdata);
+                end
+            end
+            @(negedge wclk);
+            winc   = 0;
+            w_done = 1;
+        endtask
+
+        // Read side: request a word per slot, wait out rempty
+        task automatic read_driver();
+            longint req, stall;
+            foreach (tp_rd_q[i]) begin
+                @(negedge rclk);
+                last_progress = $realtime;
+                rinc = tp_rd_q[i];
+                if (tp_rd_q[i]) begin
+                    req   = rcycle;
+                    stall = 0;
+                    forever begin
+                        @(posedge rclk);
+                        if (!rempty) break;
+                        stall++;
+                    end
+                    $fwrite(f_tp, "R %0.3f %0d %0d %h\n", $realtime, req, stall, rdata);
+                end
+            end
+            @(negedge rclk);
+            rinc   = 0;
+            r_done = 1;
+        endtask
+
+        task automatic run_throughput();
+            // Load every slot first so both drivers run free of file I/O
+            while (!$feof(f_in)) begin
+                scan_res = $fscanf(f_in, "%b %b %b %h\n", f_rst, f_wr, f_rd, f_data_val);
+                if (scan_res != 4 || f_rst) continue;
+                tp_wr_q.push_back(f_wr);
+                tp_rd_q.push_back(f_rd);
+                tp_data_q.push_back(f_data_val);
+            end
+
+            f_tp = $fopen("throughput.txt", "w");
+            `ifdef ASYNC_MODE
+                $fwrite(f_tp, "# wclk_period %0.3f\n# rclk_period %0.3f\n", wclk_period, rclk_period);
+            `else
+                $fwrite(f_tp, "# wclk_period %0.3f\n# rclk_period %0.3f\n", wclk_period, wclk_period);
+            `endif
+            $fwrite(f_tp, "# depth %0d\n", 1 << ADDR_WIDTH);
+
+            last_progress = $realtime;
+            fork
+                write_driver();
+                read_driver();
+            join_none
+
+            while (!(w_done && r_done) &&
+                   ($realtime - last_progress) < 32 * (wclk_period + rclk_period))
+                @(posedge wclk);
+            if (!(w_done && r_done))
+                $display("Throughput: drivers idle, stopping (unmatched writes/reads in stimulus)");
+            disable fork;
+            $fclose(f_tp);
+        endtask
+    `endif
+
+    // Record one response line
+    task automatic log_response(input logic clk_val);
+        `ifdef BINARY_TRACE
+            $fwrite(f_out, "%c%c%c%c%c%c%c%c%c%c%c%c",
+                    8'(clk_val), 8'(rst_n), 8'(winc), 8'(rinc),
+                    8'(wfull), 8'(rempty), 8'h00, 8'h00,
+                    8'(32'(rdata) >> 24), 8'(32'(rdata) >> 16),
+                    8'(32'(rdata) >> 8), 8'(32'(rdata)));
+        `else
+            $fwrite(f_out, "%b %b %b %b %b %b %h\n",
+                    clk_val, rst_n, winc, rinc, wfull, rempty, rdata);
+        `endif
+    endtask
+
+    // Apply one stimulus transaction to the DUT
+    task automatic drive_txn();
+        `ifdef ASYNC_MODE
+            // ASYNC: Drive writes on wclk, reads on rclk
+            if (f_wr) begin
+                @(negedge wclk);
+                rst_n = f_rst ? 1'b0 : 1'b1;
+                winc  = 1;
+                wdata = f_data_val;
+                @(negedge wclk);
+                winc  = 0;
+            end
+
+            if (f_rd) begin
+                @(negedge rclk);
+                rinc = 1;
+                #1;  // Combinational settle
+                // Sample rdata NOW, before posedge advances pointer
+                log_response(rclk);
+                @(posedge rclk);  // Pointer advances here
+                @(negedge rclk);
+                rinc = 0;
+            end
+        `else
+            // SYNC: Original behavior
+            @(negedge wclk);
+            rst_n = f_rst ? 1'b0 : 1'b1;
+            winc  = f_wr;
+            rinc  = f_rd;
+            wdata = f_data_val;
+
+            log_response(wclk);
+        `endif
+    endtask
+
     initial begin
-        f_in  = $fopen("stimulus.txt", "r");
-        f_out = $fopen("response.txt", "w");
-        
+        `ifdef BINARY_TRACE
+            f_in  = $fopen("stimulus.bin", "rb");
+            f_out = $fopen("response.bin", "wb");
+        `else
+            f_in  = $fopen("stimulus.txt", "r");
+            f_out = $fopen("response.txt", "w");
+        `endif
+
         if (f_in == 0) begin
-            $display("Error: Could not open stimulus.txt");
+            $display("Error: Could not open stimulus file");
             $finish;
         end
 
         rst_n = 0; winc = 0; rinc = 0; wdata = 0;
         #100;
         rst_n = 1;
-        
+
         `ifdef ASYNC_MODE
             // Extra settling time for synchronizers after reset
             repeat(4) @(posedge rclk);
         `endif
 
-        while (!$feof(f_in)) begin
-            scan_res = $fscanf(f_in, "%b %b %b %h\n", f_rst, f_wr, f_rd, f_data_val);
-            if (scan_res != 4) continue;
-            
-            `ifdef ASYNC_MODE
-                // ASYNC: Drive writes on wclk, reads on rclk
-                if (f_wr) begin
-                    @(negedge wclk);
-                    rst_n = f_rst ? 1'b0 : 1'b1;
-                    winc  = 1;
-                    wdata = f_data_val;
-                    @(negedge wclk);
-                    winc  = 0;
-                end
-                
-                if (f_rd) begin
-                    @(negedge rclk);
-                    rinc = 1;
-                    #1;  // Combinational settle
-                    // Sample rdata NOW, before posedge advances pointer
-                    $fwrite(f_out, "%b %b %b %b %b %b %h\n", 
-                            rclk, rst_n, winc, rinc, wfull, rempty, rdata);
-                    @(posedge rclk);  // Pointer advances here
-                    @(negedge rclk);
-                    rinc = 0;
+        `ifdef THROUGHPUT_MODE
+            run_throughput();
+        `elsif BINARY_TRACE
+            // Bulk-load the stimulus one chunk of records at a time
+            n_bytes = $fread(stim_mem, f_in);
+            while (n_bytes > 0) begin
+                n_records = n_bytes / 8;
+                for (rec = 0; rec < n_records; rec++) begin
+                    f_rst      = stim_mem[rec][56];
+                    f_wr       = stim_mem[rec][48];
+                    f_rd       = stim_mem[rec][40];
+                    f_data_val = stim_mem[rec][DATA_WIDTH-1:0];
+                    drive_txn();
                 end
-            `else
-                // SYNC: Original behavior
-                @(negedge wclk);
-                rst_n = f_rst ? 1'b0 : 1'b1;
-                winc  = f_wr;
-                rinc  = f_rd;
-                wdata = f_data_val;
-                
-                $fwrite(f_out, "%b %b %b %b %b %b %h\n", 
-                        wclk, rst_n, winc, rinc, wfull, rempty, rdata);
-            `endif
-        end
-        
+                n_bytes = $fread(stim_mem, f_in);
+            end
+        `else
+            while (!$feof(f_in)) begin
+                scan_res = $fscanf(f_in, "%b %b %b %h\n", f_rst, f_wr, f_rd, f_data_val);
+                if (scan_res != 4) continue;
+                drive_txn();
+            end
+        `endif
+
         $fclose(f_in);
         $fclose(f_out);
         $finish;